@@ -8,20 +8,11 @@ tool invocation with built-in security.
 Author: ArmorIQ Team <license@armoriq.io>
 """
 
-from .client import ArmorIQClient
-from .session import (
-    ArmorIQSession,
-    EnforceResult,
-    ReportOptions,
-    SessionMode,
-    SessionOptions,
-)
-from .plan_builder import (
-    ToolNameParser,
-    build_plan_from_tool_calls,
-    default_tool_name_parser,
-    hash_tool_calls,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+# Exceptions have no third-party dependencies and are imported eagerly, so
+# ``from armoriq_sdk import InvalidTokenException`` stays cheap.
 from .exceptions import (
     ArmorIQException,
     ConfigurationException,
@@ -33,27 +24,111 @@ from .exceptions import (
     PolicyHoldException,
     TokenExpiredException,
 )
-from .models import (
-    ApprovedDelegation,
-    DelegationRequest,
-    DelegationRequestParams,
-    DelegationRequestResult,
-    DelegationResult,
-    HoldInfo,
-    IntentToken,
-    InvokeOptions,
-    MCPInvocation,
-    MCPInvocationResult,
-    MCPSemanticMetadata,
-    McpCredential,
-    McpCredentialMap,
-    PlanCapture,
-    PolicyContext,
-    SDKConfig,
-    ToolCall,
-    ToolSemanticEntry,
+
+# Everything else pulls in httpx/pydantic, so it is imported on first
+# attribute access (PEP 562): name -> defining submodule.
+_LAZY: Dict[str, str] = {
+    "ArmorIQClient": ".client",
+    "AsyncArmorIQClient": ".async_client",
+    "ArmorIQSession": ".session",
+    "EnforceResult": ".session",
+    "ReportOptions": ".session",
+    "SessionMode": ".session",
+    "SessionOptions": ".session",
+    "ToolNameParser": ".plan_builder",
+    "build_plan_from_tool_calls": ".plan_builder",
+    "default_tool_name_parser": ".plan_builder",
+    "hash_tool_calls": ".plan_builder",
+    "ApprovedDelegation": ".models",
+    "DelegationRequest": ".models",
+    "DelegationRequestParams": ".models",
+    "DelegationRequestResult": ".models",
+    "DelegationResult": ".models",
+    "HoldInfo": ".models",
+    "IntentToken": ".models",
+    "InvokeOptions": ".models",
+    "MCPInvocation": ".models",
+    "MCPInvocationResult": ".models",
+    "MCPSemanticMetadata": ".models",
+    "McpCredential": ".models",
+    "McpCredentialMap": ".models",
+    "PlanCapture": ".models",
+    "PolicyContext": ".models",
+    "SDKConfig": ".models",
+    "ToolCall": ".models",
+    "ToolSemanticEntry": ".models",
+}
+
+if TYPE_CHECKING:  # static view of _LAZY for type checkers and IDEs
+    from .async_client import AsyncArmorIQClient
+    from .client import ArmorIQClient
+    from .models import (
+        ApprovedDelegation,
+        DelegationRequest,
+        DelegationRequestParams,
+        DelegationRequestResult,
+        DelegationResult,
+        HoldInfo,
+        IntentToken,
+        InvokeOptions,
+        MCPInvocation,
+        MCPInvocationResult,
+        MCPSemanticMetadata,
+        McpCredential,
+        McpCredentialMap,
+        PlanCapture,
+        PolicyContext,
+        SDKConfig,
+        ToolCall,
+        ToolSemanticEntry,
+    )
+    from .plan_builder import (
+        ToolNameParser,
+        build_plan_from_tool_calls,
+        default_tool_name_parser,
+        hash_tool_calls,
+    )
+    from .session import (
+        ArmorIQSession,
+        EnforceResult,
+        ReportOptions,
+        SessionMode,
+        SessionOptions,
+    )
+
+# Optional framework integrations (each requires its own extra to be
+# installed); resolved lazily like the rest, AttributeError if unavailable.
+_INTEGRATIONS = (
+    "ArmorIQCrew",
+    "ArmorIQLangChain",
+    "ArmorIQADK",
+    "ArmorIQOpenAI",
+    "ArmorIQAnthropic",
+    "ArmorIQStrands",
 )
 
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+    elif name in _INTEGRATIONS:
+        try:
+            value = getattr(importlib.import_module(".integrations", __name__), name)
+        except Exception as e:
+            raise AttributeError(
+                f"{name} is unavailable; install its armoriq-sdk extra ({e})"
+            ) from e
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_INTEGRATIONS))
+
+
 __version__ = "0.3.9"
 VERSION = __version__
 __author__ = "ArmorIQ Team"
@@ -64,6 +139,7 @@ EMAIL = __email__
 __all__ = [
     # Core
     "ArmorIQClient",
+    "AsyncArmorIQClient",
     "ArmorIQSession",
     "SessionOptions",
     "SessionMode",
@@ -108,22 +184,3 @@ __all__ = [
     "AUTHOR",
     "EMAIL",
 ]
-
-# Optional framework integrations (each requires its own extra to be installed)
-try:
-    from .integrations import (
-        ArmorIQAnthropic,
-        ArmorIQCrew,
-        ArmorIQGoogleADK,
-        ArmorIQLangChain,
-        ArmorIQOpenAI,
-    )
-    __all__ += [
-        "ArmorIQCrew",
-        "ArmorIQLangChain",
-        "ArmorIQGoogleADK",
-        "ArmorIQOpenAI",
-        "ArmorIQAnthropic",
-    ]
-except Exception:
-    pass
@@ -0,0 +1,126 @@
+"""
+Bounded in-process caches used by ArmorIQClient.
+
+``LRUCache`` is a thread-safe OrderedDict with a hard capacity.
+``TokenCache`` specialises it for intent tokens: entries expire with the
+token itself, and expired entries are swept periodically so they don't
+linger until they happen to be looked up.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from .models import IntentToken
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe least-recently-used cache with O(1) get/put."""
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: K, value: V) -> None:
+        # Caller holds self._lock.
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[V], bool]) -> int:
+        """Drop every entry whose value matches ``predicate``. Returns the number removed."""
+        return self.discard_items_if(lambda _key, value: predicate(value))
+
+    def discard_items_if(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop every entry whose (key, value) matches ``predicate``. Returns the number removed."""
+        with self._lock:
+            stale = [k for k, v in self._data.items() if predicate(k, v)]
+            for k in stale:
+                del self._data[k]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+
+class TokenCache(LRUCache[K, IntentToken]):
+    """LRU cache of intent tokens that never returns an expired token."""
+
+    def __init__(self, maxsize: int = 1024, sweep_every: int = 64):
+        super().__init__(maxsize)
+        self.sweep_every = sweep_every
+        self._puts = 0
+
+    def get(self, key: K) -> Optional[IntentToken]:
+        with self._lock:
+            token = self._data.get(key)
+            if token is None:
+                return None
+            if token.is_expired:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return token
+
+    def put(self, key: K, value: IntentToken) -> None:
+        with self._lock:
+            self._store(key, value)
+            self._puts += 1
+            if self._puts % self.sweep_every == 0:
+                self._sweep()
+
+    def sweep(self) -> int:
+        """Drop every expired entry. Returns the number removed."""
+        with self._lock:
+            return self._sweep()
+
+    def _sweep(self) -> int:
+        # Caller holds self._lock.
+        expired = [k for k, t in self._data.items() if t.is_expired]
+        for k in expired:
+            del self._data[k]
+        return len(expired)
+
+    def invalidate(self, plan_hash: str) -> int:
+        """Drop every cached token minted for ``plan_hash``. Returns the number removed."""
+        with self._lock:
+            stale = [k for k, t in self._data.items() if t.plan_hash == plan_hash]
+            for k in stale:
+                del self._data[k]
+            return len(stale)
+
+    def discard(self, token: IntentToken) -> int:
+        """Drop every entry holding this exact token. Returns the number removed."""
+        return self.discard_if(lambda t: t is token)
+
+    def invalidate_all(self) -> None:
+        self.clear()
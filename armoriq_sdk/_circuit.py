@@ -0,0 +1,58 @@
+"""
+Consecutive-failure circuit breaker for proxy calls.
+
+After ``threshold`` consecutive failures for a key the circuit opens and
+``allow()`` refuses calls for ``reset_after`` seconds. The next call after
+that is let through as a trial (half-open): success closes the circuit,
+failure re-opens it for another ``reset_after`` seconds.
+"""
+
+import threading
+import time
+from typing import Dict, Hashable, Tuple
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        # key -> (consecutive failures, monotonic time the circuit opened)
+        self._state: Dict[Hashable, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: Hashable) -> bool:
+        """False while the circuit for ``key`` is open."""
+        if self.threshold <= 0:
+            return True
+        state = self._state.get(key)
+        if state is None or state[0] < self.threshold:
+            return True
+        with self._lock:
+            failures, opened_at = self._state.get(key, (0, 0.0))
+            if failures < self.threshold:
+                return True
+            if time.monotonic() - opened_at < self.reset_after:
+                return False
+            # Half-open: admit this call, keep others out until it reports back.
+            self._state[key] = (failures, time.monotonic())
+            return True
+
+    def retry_in(self, key: Hashable) -> float:
+        """Seconds until an open circuit admits a trial call (0 if closed)."""
+        failures, opened_at = self._state.get(key, (0, 0.0))
+        if failures < self.threshold:
+            return 0.0
+        return max(0.0, self.reset_after - (time.monotonic() - opened_at))
+
+    def record_success(self, key: Hashable) -> None:
+        if key in self._state:
+            with self._lock:
+                self._state.pop(key, None)
+
+    def record_failure(self, key: Hashable) -> None:
+        with self._lock:
+            failures, opened_at = self._state.get(key, (0, 0.0))
+            failures += 1
+            if failures >= self.threshold:
+                opened_at = time.monotonic()
+            self._state[key] = (failures, opened_at)
@@ -0,0 +1,46 @@
+"""
+JSON codec for the SDK's transport paths.
+
+Uses ``orjson`` when it is installed (``pip install armoriq-sdk[speedups]``)
+and falls back to the stdlib ``json`` module otherwise. Signed payloads keep
+going through ``crypto_verify.canonical_json``: the IAP signer's byte layout
+(``ensure_ascii=True``) is not something orjson reproduces.
+"""
+
+import json
+from typing import Any, Mapping, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    _orjson = None
+
+HAS_ORJSON = _orjson is not None
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes, for request bodies."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_object(obj: Mapping[str, Any], fragments: Mapping[str, bytes]) -> bytes:
+    """
+    Encode ``obj`` as a JSON object with extra members whose values are
+    already-encoded JSON (``fragments``), spliced in without re-encoding.
+    Keys must not appear in both mappings.
+    """
+    parts = [dumps(key) + b":" + value for key, value in fragments.items()]
+    if obj:
+        parts.append(dumps(obj)[1:-1])
+    return b"{" + b",".join(parts) + b"}"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document. Raises ``ValueError`` on malformed input."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
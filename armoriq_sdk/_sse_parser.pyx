@@ -0,0 +1,32 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled SSE scanner for ArmorIQClient.invoke().
+
+Optional build (see setup.py). Behaviour must match the pure-Python
+``_parse_sse_body`` in client.py, which is used when this extension is
+not compiled.
+"""
+
+from libc.string cimport memcmp
+
+from ._json import loads as _json_loads
+
+
+cpdef object _parse_sse_body(bytes content):
+    """Return the first decodable ``data:`` event of an SSE body, or None."""
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t n = len(content)
+    cdef Py_ssize_t end
+    cdef const unsigned char* buf = content
+    loads = _json_loads
+    while i < n:
+        end = content.find(b"\n", i)
+        if end == -1:
+            end = n
+        if end - i >= 6 and memcmp(buf + i, b"data: ", 6) == 0:
+            try:
+                return loads(content[i + 6:end]) or None
+            except ValueError:
+                pass
+        i = end + 1
+    return None
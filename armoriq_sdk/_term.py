@@ -0,0 +1,34 @@
+"""
+ANSI styles shared by the CLI modules.
+
+Each style renders as its escape code only while ``sys.stdout`` is a
+terminal, checked when the string is formatted (not at import), so pipes,
+CI logs and redirected output stay plain.
+"""
+
+import sys
+
+
+class _Style:
+    """An ANSI SGR code that formats to "" when stdout isn't a TTY."""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code: int):
+        self.code = f"\033[{code}m"
+
+    def __str__(self) -> str:
+        isatty = getattr(sys.stdout, "isatty", None)
+        return self.code if isatty is not None and isatty() else ""
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+
+BOLD = _Style(1)
+DIM = _Style(2)
+RED = _Style(31)
+GREEN = _Style(32)
+YELLOW = _Style(33)
+CYAN = _Style(36)
+RESET = _Style(0)
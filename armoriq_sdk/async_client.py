@@ -0,0 +1,445 @@
+"""
+ArmorIQ SDK Async Client - asyncio front-end for the network-bound calls.
+
+AsyncArmorIQClient wraps an ArmorIQClient for configuration, request
+building and response parsing, and sends the requests over a shared
+``httpx.AsyncClient`` so concurrent ``invoke()`` calls overlap their
+round trips instead of serialising on them. HTTP/2 is enabled when the
+``h2`` package is installed (``pip install armoriq-sdk[speedups]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+import httpx
+
+from ._json import dumps as _json_dumps
+from .client import ArmorIQClient
+from .exceptions import (
+    ConfigurationException,
+    DelegationException,
+    IntentMismatchException,
+    InvalidTokenException,
+    MCPInvocationException,
+    PolicyBlockedException,
+    PolicyHoldException,
+)
+from .models import (
+    DelegationResult,
+    IntentToken,
+    MCPInvocation,
+    MCPInvocationResult,
+    PlanCapture,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncArmorIQClient:
+    """
+    Async client for ArmorIQ SDK.
+
+    Accepts the same keyword arguments as ArmorIQClient. The wrapped sync
+    client is available as ``.sync`` for the APIs not mirrored here
+    (trust updates, delegation requests, metadata, ...).
+
+    The proxy ``/health`` API-key probe is not run on construction, since
+    it would block the event loop; a revoked key surfaces as an
+    InvalidTokenException on the first token request instead.
+
+    Pass the same ``async_transport`` to several clients (e.g. one per
+    agent) to share one connection pool; aclose() leaves it open for its
+    owner to close. The transport then owns HTTP/2, pool limits and TLS
+    verification: ``verify_ssl`` only applies to the wrapped sync client,
+    and passing ``http2``/``max_connections``/``max_keepalive_connections``
+    together with ``async_transport`` raises ConfigurationException.
+
+    Without a transport, ``http2`` defaults to the wrapped client's choice
+    (see its ``prefer_h2`` argument) and the pool allows 100 connections,
+    20 of them kept alive.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: Any,
+    ):
+        if async_transport is not None and (
+            http2 is not None
+            or max_connections is not None
+            or max_keepalive_connections is not None
+        ):
+            raise ConfigurationException(
+                "http2/max_connections/max_keepalive_connections have no effect "
+                "with async_transport; configure them on the transport instead"
+            )
+        kwargs["_skip_api_key_validation"] = True
+        self.sync = ArmorIQClient(**kwargs)
+
+        self._owns_transport = async_transport is None
+        self.http_client = httpx.AsyncClient(
+            transport=async_transport,
+            http2=self.sync._http2 if http2 is None else http2,
+            timeout=self.sync.timeout,
+            verify=self.sync.verify_ssl,
+            headers={
+                "User-Agent": self.sync.http_client.headers["User-Agent"],
+                "Authorization": f"Bearer {self.sync.api_key}",
+            },
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=100 if max_connections is None else max_connections,
+                max_keepalive_connections=(
+                    20 if max_keepalive_connections is None else max_keepalive_connections
+                ),
+            ),
+        )
+        self._refresh_tasks: Set["asyncio.Task[None]"] = set()
+
+    async def __aenter__(self) -> "AsyncArmorIQClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close both HTTP clients and cleanup resources.
+
+        Background token refreshes still in flight are cancelled first.
+        """
+        tasks = list(self._refresh_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_transport:
+            try:
+                await self.http_client.aclose()
+            except Exception:
+                pass
+        self.sync.close()
+
+    async def warmup(self) -> None:
+        """
+        Async counterpart of ArmorIQClient.warmup(): one ``HEAD /health``
+        per distinct endpoint, sent concurrently. Failures are ignored.
+        Start it with ``asyncio.create_task`` to overlap the handshakes
+        with a token request.
+        """
+
+        async def head(endpoint: str) -> None:
+            try:
+                await self.http_client.head(f"{endpoint}/health", timeout=2.0)
+            except Exception as e:
+                logger.debug("Warmup request to %s failed: %s", endpoint, e)
+
+        await asyncio.gather(*(head(e) for e in self.sync._warmup_endpoints()))
+
+    async def _retry_post(
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        """Async counterpart of ArmorIQClient._retry_post (same backoff and
+        Idempotency-Key reuse)."""
+        merged_headers = dict(headers or {})
+        if idempotency_key and "Idempotency-Key" not in merged_headers:
+            merged_headers["Idempotency-Key"] = idempotency_key
+
+        attempts = max(1, int(self.sync.max_retries) + 1)
+        last_exc: Optional[Exception] = None
+        last_response: Optional[httpx.Response] = None
+        for i in range(attempts):
+            try:
+                response = await self.http_client.post(
+                    url,
+                    json=json,
+                    content=content,
+                    headers=merged_headers,
+                    timeout=timeout if timeout is not None else self.sync.timeout,
+                )
+                if not self.sync._should_retry(response.status_code):
+                    return response
+                last_response = response
+            except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError) as e:
+                last_exc = e
+            if i < attempts - 1:
+                await asyncio.sleep(min(1.0 * (2 ** i), 4.0))
+        if last_response is not None:
+            return last_response
+        if last_exc is not None:
+            raise last_exc
+        raise RuntimeError("retry loop exited without a result")
+
+    # ─── Plan / Token ──────────────────────────────────────────────────
+
+    def capture_plan(
+        self,
+        llm: str,
+        prompt: str,
+        plan: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> PlanCapture:
+        """Capture an execution plan structure (no I/O, so not a coroutine)."""
+        return self.sync.capture_plan(llm, prompt, plan=plan, metadata=metadata)
+
+    async def get_intent_token(
+        self,
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]] = None,
+        validity_seconds: float = 60.0,
+    ) -> IntentToken:
+        """Request a signed intent token from IAP for the given plan."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Requesting intent token for plan with %d steps",
+                len(plan_capture.plan.get("steps", [])),
+            )
+        cache_key = self.sync._token_cache_key(plan_capture, policy, validity_seconds)
+        payload = self.sync._token_payload(plan_capture, policy, validity_seconds)
+        if cache_key is not None:
+            cached = self.sync._cached_token(cache_key, validity_seconds)
+            if cached is not None:
+                if self.sync._claim_refresh(cache_key, cached, validity_seconds):
+                    task = asyncio.get_running_loop().create_task(
+                        self._refresh_token(
+                            cache_key, payload, plan_capture, policy, validity_seconds
+                        )
+                    )
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return cached
+
+        token = await self._issue_token(payload, plan_capture, policy, validity_seconds)
+        if cache_key is not None:
+            self.sync._token_cache.put(cache_key, token)
+        return token
+
+    async def get_intent_tokens_batch(
+        self,
+        plan_captures: Sequence[PlanCapture],
+        policy: Optional[Dict[str, Any]] = None,
+        validity_seconds: float = 60.0,
+    ) -> List[IntentToken]:
+        """
+        Request intent tokens for several plans in one round trip (see
+        ArmorIQClient.get_intent_tokens_batch). Without a backend batch
+        endpoint the per-plan requests run concurrently via asyncio.gather.
+        """
+        sync = self.sync
+        tokens, keys, misses = sync._cached_tokens(plan_captures, policy, validity_seconds)
+        if not misses:
+            return tokens  # type: ignore[return-value]
+
+        pending = [plan_captures[i] for i in misses]
+        payloads = [sync._token_payload(pc, policy, validity_seconds) for pc in pending]
+        issued: Optional[List[IntentToken]] = None
+        if sync._supports_batch is not False:
+            try:
+                response = await self._retry_post(
+                    sync._token_batch_url,
+                    content=_json_dumps({"batch": payloads}),
+                    headers=sync._json_api_key_headers,
+                    timeout=30.0,
+                    idempotency_key=secrets.token_hex(16),
+                )
+            except Exception as e:
+                raise InvalidTokenException(f"Failed to get intent tokens: {e}")
+            issued = sync._tokens_from_batch_response(
+                response, pending, policy, validity_seconds
+            )
+        if issued is None:
+            issued = list(
+                await asyncio.gather(
+                    *(
+                        self._issue_token(payload, pc, policy, validity_seconds)
+                        for payload, pc in zip(payloads, pending)
+                    )
+                )
+            )
+
+        for i, token in zip(misses, issued):
+            tokens[i] = token
+            if keys[i] is not None:
+                sync._token_cache.put(keys[i], token)
+        return tokens  # type: ignore[return-value]
+
+    async def _issue_token(
+        self,
+        payload: Dict[str, Any],
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> IntentToken:
+        try:
+            response = await self._retry_post(
+                self.sync._token_url,
+                content=_json_dumps(payload),
+                headers=self.sync._json_api_key_headers,
+                timeout=30.0,
+                idempotency_key=secrets.token_hex(16),
+            )
+            return self.sync._token_from_response(
+                response, plan_capture, policy, validity_seconds
+            )
+        except (InvalidTokenException, PolicyBlockedException):
+            raise
+        except Exception as e:
+            raise InvalidTokenException(f"Failed to get intent token: {e}")
+
+    async def _refresh_token(
+        self,
+        cache_key: Tuple[Any, ...],
+        payload: Dict[str, Any],
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> None:
+        try:
+            token = await self._issue_token(payload, plan_capture, policy, validity_seconds)
+            self.sync._token_cache.put(cache_key, token)
+        except Exception as e:
+            logger.debug("Background intent token refresh failed: %s", e)
+        finally:
+            with self.sync._refresh_lock:
+                self.sync._refreshing.discard(cache_key)
+
+    def verify_token(self, intent_token: IntentToken) -> bool:
+        """Verify an intent token locally (no I/O, so not a coroutine)."""
+        return self.sync.verify_token(intent_token)
+
+    # ─── MCP invocation ────────────────────────────────────────────────
+
+    async def invoke(
+        self,
+        mcp: str,
+        action: str,
+        intent_token: IntentToken,
+        params: Optional[Dict[str, Any]] = None,
+        merkle_proof: Optional[List[Any]] = None,
+        user_email: Optional[str] = None,
+    ) -> MCPInvocationResult:
+        """Invoke an MCP action through the ArmorIQ proxy with token verification."""
+        logger.info("Invoking MCP action: mcp=%s, action=%s", mcp, action)
+        url, body, headers = self.sync._build_invoke_request(
+            mcp, action, intent_token, params, merkle_proof, user_email
+        )
+        self.sync._check_circuit(mcp, action)
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            response = await self.http_client.post(url, content=body, headers=headers)
+            self.sync._record_circuit(mcp, response.status_code)
+            return self.sync._invoke_result(
+                response, mcp, action, intent_token, loop.time() - start
+            )
+        except (
+            MCPInvocationException,
+            IntentMismatchException,
+            InvalidTokenException,
+            PolicyBlockedException,
+            PolicyHoldException,
+        ):
+            raise
+        except Exception as e:
+            if isinstance(e, httpx.TransportError):
+                self.sync._circuit.record_failure(mcp)
+            raise MCPInvocationException(
+                f"MCP invocation failed: {e}", mcp=mcp, action=action
+            )
+
+    async def invoke_batch(
+        self,
+        specs: Sequence[MCPInvocation],
+        max_concurrent: int = 8,
+        fail_fast: bool = False,
+    ) -> List[Union[MCPInvocationResult, Exception]]:
+        """
+        Invoke several MCP actions concurrently (same contract as
+        ArmorIQClient.invoke_batch).
+
+        Results come back in the order of ``specs``; a failed call leaves its
+        exception in that slot. With ``fail_fast=True`` the first failure
+        cancels the calls still in flight and is raised instead.
+        """
+        if not specs:
+            return []
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def run(spec: MCPInvocation) -> MCPInvocationResult:
+            async with semaphore:
+                return await self.invoke(
+                    spec.mcp,
+                    spec.action,
+                    spec.intent_token,
+                    params=spec.params,
+                    merkle_proof=spec.merkle_proof,
+                    user_email=(spec.iam_context or {}).get("email"),
+                )
+
+        tasks = [asyncio.ensure_future(run(spec)) for spec in specs]
+        if fail_fast:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            for task in tasks:
+                if task in done and task.exception() is not None:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    raise task.exception()  # type: ignore[misc]
+        return list(await asyncio.gather(*tasks, return_exceptions=True))
+
+    # ─── Delegation ────────────────────────────────────────────────────
+
+    async def delegate(
+        self,
+        intent_token: IntentToken,
+        delegate_public_key: str,
+        validity_seconds: int = 3600,
+        allowed_actions: Optional[List[str]] = None,
+        target_agent: Optional[str] = None,
+        subtask: Optional[Dict[str, Any]] = None,
+    ) -> DelegationResult:
+        """Delegate authority to another agent using CSRG token delegation
+        (cached like ArmorIQClient.delegate)."""
+        cache_key = self.sync._delegation_key(
+            intent_token, delegate_public_key, validity_seconds,
+            allowed_actions, target_agent, subtask,
+        )
+        cached = self.sync._cached_delegation(cache_key)
+        if cached is not None:
+            return cached
+
+        body = self.sync._delegate_body(
+            intent_token, delegate_public_key, validity_seconds,
+            allowed_actions, target_agent, subtask,
+        )
+        try:
+            response = await self.http_client.post(
+                self.sync._delegate_url,
+                content=body,
+                headers={"Content-Type": "application/json"},
+                timeout=10.0,
+            )
+            result = ArmorIQClient._delegation_from_response(
+                response, intent_token, delegate_public_key, target_agent
+            )
+        except DelegationException:
+            raise
+        except Exception as e:
+            raise DelegationException(f"Delegation failed: {e}", target_agent=target_agent)
+        if cache_key is not None:
+            self.sync._delegation_cache.put(cache_key, result)
+        return result
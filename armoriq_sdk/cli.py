@@ -9,14 +9,16 @@ import json
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import httpx
 
+from ._term import RED, RESET, YELLOW
 from .config import (
     ArmorIQConfig,
     ArmorIQConfigError,
@@ -277,6 +279,16 @@ def discover_mcp_tools(server: MCPServerConfig, timeout: float = 8.0) -> MCPDisc
     return MCPDiscoveryResult(reachable=False, tools=[], error=last_error or "unreachable")
 
 
+def _discover_all(servers: Sequence[MCPServerConfig]) -> List[MCPDiscoveryResult]:
+    """Run discover_mcp_tools for every server concurrently, so one slow or
+    unreachable server costs its own timeout rather than delaying the rest.
+    Results are in ``servers`` order."""
+    if len(servers) <= 1:
+        return [discover_mcp_tools(server) for server in servers]
+    with ThreadPoolExecutor(max_workers=min(len(servers), 8)) as pool:
+        return list(pool.map(discover_mcp_tools, servers))
+
+
 def validate_api_key(api_key: str, proxy_url: str, timeout: float = 8.0) -> None:
     """Verify the API key by hitting either the backend's SDK bootstrap
     endpoint (local dev) or the proxy's health endpoint (prod default).
@@ -447,8 +459,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
     _print(f"{CHECK} API key authenticated")
 
     discovered: Dict[str, List[str]] = {}
-    for server in config.mcp_servers:
-        discovery = discover_mcp_tools(server)
+    for server, discovery in zip(config.mcp_servers, _discover_all(config.mcp_servers)):
         if not discovery.reachable:
             raise CLIError(
                 f"{server.id} MCP not reachable: {discovery.error or 'unknown error'}"
@@ -478,8 +489,7 @@ def cmd_register(args: argparse.Namespace) -> int:
         response = _register_with_control_plane(config)
 
     discovered: Dict[str, List[str]] = {}
-    for server in config.mcp_servers:
-        result = discover_mcp_tools(server)
+    for server, result in zip(config.mcp_servers, _discover_all(config.mcp_servers)):
         discovered[server.id] = result.tools if result.reachable else []
 
     _print(f"{CHECK} Agent {config.identity.agent_id} registered")
@@ -765,7 +775,7 @@ def cmd_keys_list(args: argparse.Namespace) -> int:
     _print("")
     if len(keys) > KEY_COUNT_WARN_THRESHOLD:
         _print(
-            f"\033[33m!\033[0m You have {len(keys)} API keys. Consider "
+            f"{YELLOW}!{RESET} You have {len(keys)} API keys. Consider "
             f"`armoriq keys prune` to revoke unused keys."
         )
     _append_log("keys-list", {"count": len(keys)})
@@ -841,7 +851,7 @@ def cmd_keys_prune(args: argparse.Namespace) -> int:
             _print(f"{CHECK} Revoked {k['id']}")
             revoked += 1
         except CLIError as exc:
-            _print(f"\033[31m✘\033[0m Failed to revoke {k['id']}: {exc}")
+            _print(f"{RED}✘{RESET} Failed to revoke {k['id']}: {exc}")
     _append_log("keys-prune", {"revoked": revoked, "candidates": len(candidates)})
     return 0
 
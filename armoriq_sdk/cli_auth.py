@@ -27,6 +27,7 @@ from urllib.parse import parse_qs, quote, urlparse
 import httpx
 
 from ._build_env import resolve as _resolve_env
+from ._term import BOLD, CYAN, DIM, GREEN, RED, RESET, YELLOW
 from .credentials import (
     Credentials,
     clear_credentials,
@@ -129,7 +130,7 @@ def cmd_login(args: argparse.Namespace) -> int:
     )
 
     print("")
-    print("  \033[1m\033[36m┃ ArmorIQ Login\033[0m")
+    print(f"  {BOLD}{CYAN}┃ ArmorIQ Login{RESET}")
     print("")
 
     port = _find_free_port()
@@ -151,7 +152,7 @@ def cmd_login(args: argparse.Namespace) -> int:
         dc = r.json()
     except Exception as exc:
         srv.shutdown()
-        print(f"  \033[31m✘\033[0m Failed to request device code: {exc}")
+        print(f"  {RED}✘{RESET} Failed to request device code: {exc}")
         return 1
 
     device_code = dc["device_code"]
@@ -171,11 +172,11 @@ def cmd_login(args: argparse.Namespace) -> int:
     try:
         webbrowser.open(browser_url)
     except Exception:
-        print("  \033[33m!\033[0m Browser didn't open automatically.")
+        print(f"  {YELLOW}!{RESET} Browser didn't open automatically.")
 
     print("  If the browser didn't open, visit:")
-    print(f"    \033[36m\033[1m{browser_url}\033[0m\n")
-    print(f"  Confirm this code in your browser: \033[1m{user_code}\033[0m\n")
+    print(f"    {CYAN}{BOLD}{browser_url}{RESET}\n")
+    print(f"  Confirm this code in your browser: {BOLD}{user_code}{RESET}\n")
 
     print("  Waiting for authorization...", end="", flush=True)
 
@@ -225,9 +226,9 @@ def cmd_login(args: argparse.Namespace) -> int:
     srv.shutdown()
 
     if result is None:
-        print(" \033[31m✘\033[0m")
+        print(f" {RED}✘{RESET}")
         msg = last_poll_err or "Timed out waiting for authorization. Run `armoriq login` again."
-        print(f"  \033[31m✘\033[0m {msg}")
+        print(f"  {RED}✘{RESET} {msg}")
         return 1
 
     save_credentials(
@@ -240,38 +241,38 @@ def cmd_login(args: argparse.Namespace) -> int:
         )
     )
 
-    print(" \033[32m✔\033[0m")
+    print(f" {GREEN}✔{RESET}")
     print("")
     email = result.get("email") or "unknown"
     org = result.get("org_id") or "unknown"
-    print(f"  \033[32m✔\033[0m Logged in as \033[1m{email}\033[0m (org: {org})")
-    print(f"  \033[32m✔\033[0m API key saved to {get_credentials_path()}")
+    print(f"  {GREEN}✔{RESET} Logged in as {BOLD}{email}{RESET} (org: {org})")
+    print(f"  {GREEN}✔{RESET} API key saved to {get_credentials_path()}")
     print("")
     return 0
 
 
 def cmd_logout(args: argparse.Namespace) -> int:
     if clear_credentials():
-        print(f"  \033[32m✔\033[0m Credentials removed from {get_credentials_path()}")
+        print(f"  {GREEN}✔{RESET} Credentials removed from {get_credentials_path()}")
     else:
-        print("  \033[2mNo credentials found — already logged out.\033[0m")
+        print(f"  {DIM}No credentials found — already logged out.{RESET}")
     return 0
 
 
 def cmd_whoami(args: argparse.Namespace) -> int:
     creds = load_credentials()
     if not creds:
-        print("  \033[2mNot logged in. Run `armoriq login` to authenticate.\033[0m")
+        print(f"  {DIM}Not logged in. Run `armoriq login` to authenticate.{RESET}")
         return 0
     print("")
-    print("  \033[1m\033[36m┃ ArmorIQ Credentials\033[0m")
+    print(f"  {BOLD}{CYAN}┃ ArmorIQ Credentials{RESET}")
     print("")
     key_preview = (creds.apiKey[:16] + "...") if len(creds.apiKey) > 16 else creds.apiKey
-    print(f"  Email:    \033[1m{creds.email or 'unknown'}\033[0m")
-    print(f"  API Key:  \033[2m{key_preview}\033[0m")
-    print(f"  User ID:  \033[2m{creds.userId or 'n/a'}\033[0m")
-    print(f"  Org ID:   \033[2m{creds.orgId or 'n/a'}\033[0m")
-    print(f"  Saved at: \033[2m{creds.savedAt or 'n/a'}\033[0m")
-    print(f"  File:     \033[2m{get_credentials_path()}\033[0m")
+    print(f"  Email:    {BOLD}{creds.email or 'unknown'}{RESET}")
+    print(f"  API Key:  {DIM}{key_preview}{RESET}")
+    print(f"  User ID:  {DIM}{creds.userId or 'n/a'}{RESET}")
+    print(f"  Org ID:   {DIM}{creds.orgId or 'n/a'}{RESET}")
+    print(f"  Saved at: {DIM}{creds.savedAt or 'n/a'}{RESET}")
+    print(f"  File:     {DIM}{get_credentials_path()}{RESET}")
     print("")
     return 0
@@ -9,18 +9,38 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import copy
 import hashlib
+import importlib.util
 import json
 import logging
 import os
 import re
 import secrets
+import threading
 import time
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import httpx
 
+from ._cache import LRUCache, TokenCache
+from ._circuit import CircuitBreaker
+from ._json import dumps as _json_dumps
+from ._json import dumps_object as _json_dumps_object
+from ._json import loads as _json_loads
 from .config import load_armoriq_config
 from .crypto_verify import verify_intent_token_signature
 from .token_usage import summarize_transcript_usage
@@ -58,6 +78,30 @@ logger = logging.getLogger(__name__)
 
 SDK_VERSION = "0.3.5"
 
+# HTTP/2 needs the optional ``h2`` package (``armoriq-sdk[speedups]``).
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# One shared pool for IAP, backend and proxy origins. Sized for agents
+# that fan out across several MCP proxies from multiple threads.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=200,
+    keepalive_expiry=30.0,
+)
+
+# Non-JSON error bodies (e.g. a load balancer's HTML error page) are quoted
+# in exception messages only up to this many bytes.
+_ERROR_SNIPPET_BYTES = 512
+
+
+def _error_detail(response: httpx.Response) -> Any:
+    """Decoded JSON body of an error response, else a bounded text snippet."""
+    content = response.content
+    try:
+        return _json_loads(content)
+    except ValueError:
+        return content[:_ERROR_SNIPPET_BYTES].decode("utf-8", "replace")
+
 
 class _EnforcementResponse(Exception):
     """Internal sentinel carrying a structured /invoke enforcement response."""
@@ -68,6 +112,40 @@ class _EnforcementResponse(Exception):
         self.status_code = status_code
 
 
+# ─── /invoke response parsers ─────────────────────────────────────────
+# invoke() picks one of these by media type instead of branching inline,
+# so each stays a small, specialised function on the hot path.
+
+
+def _parse_json_body(content: bytes) -> Optional[Dict[str, Any]]:
+    """Parse a plain JSON /invoke body. Non-object or malformed bodies map to {}."""
+    try:
+        data = _json_loads(content)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _parse_sse_body(content: bytes) -> Optional[Dict[str, Any]]:
+    """Return the first decodable ``data:`` event of an SSE body, or None."""
+    loads = _json_loads
+    for line in content.split(b"\n"):
+        if line.startswith(b"data: "):
+            try:
+                return loads(line[6:]) or None
+            except ValueError:
+                continue
+    return None
+
+
+try:  # compiled scanner, built by setup.py only with ARMORIQ_BUILD_EXT=1
+    from ._sse_parser import _parse_sse_body as _compiled_parse_sse_body
+except ImportError:
+    _compiled_parse_sse_body = None
+
+_PARSERS = {"text/event-stream": _compiled_parse_sse_body or _parse_sse_body}
+
+
 class ArmorIQClient:
     """
     Main client for ArmorIQ SDK.
@@ -99,6 +177,18 @@ class ArmorIQClient:
     LOCAL_ARMORCLAW_PROXY_ENDPOINT = "http://127.0.0.1:3001"
     LOCAL_ARMORCLAW_BACKEND_ENDPOINT = "http://127.0.0.1:8081"
 
+    # Upper bound on cached intent tokens; least-recently-used are evicted.
+    TOKEN_CACHE_SIZE = 1024
+    # A cached delegation is reused only while it has at least this many
+    # seconds left; closer to expiry, delegate() asks the backend again.
+    DELEGATION_REUSE_MARGIN = 60.0
+    # A cached intent token is only served while it has at least
+    # max(MIN_TOKEN_LIFETIME, MIN_TOKEN_SHARE * validity_seconds) seconds
+    # left; below that, get_intent_token() mints a replacement synchronously
+    # so callers always get a token worth most of what they asked for.
+    MIN_TOKEN_LIFETIME = 2.0
+    MIN_TOKEN_SHARE = 0.5
+
     def __init__(
         self,
         iap_endpoint: Optional[str] = None,
@@ -114,6 +204,14 @@ class ArmorIQClient:
         api_key: Optional[str] = None,
         use_production: bool = True,
         mcp_credentials: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        refresh_ahead_seconds: float = 5.0,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_reset_seconds: float = 30.0,
+        transport: Optional[httpx.BaseTransport] = None,
+        preconnect: bool = False,
+        prefer_h2: bool = True,
+        user_email: Optional[str] = None,
+        cache_tokens: bool = True,
         _skip_api_key_validation: bool = False,
     ):
         resolved_api_key = api_key or os.getenv("ARMORIQ_API_KEY") or ""
@@ -171,6 +269,8 @@ class ArmorIQClient:
         self.context_id = context_id or os.getenv("CONTEXT_ID", "default")
         self.api_key = resolved_api_key
         self.user_email_override: Optional[str] = None
+        # Default end-user email for invoke() calls that don't pass one.
+        self.user_email = user_email
 
         if not self.api_key:
             raise ConfigurationException(
@@ -198,7 +298,37 @@ class ArmorIQClient:
         if not self.agent_id:
             self.agent_id = "__sdk_multiuser__"
 
+        # Invariant pieces of the hot-path request bodies/headers, built once
+        # and spread into each request rather than re-assembled per call.
+        self._identity = MappingProxyType({
+            "user_id": self.user_id,
+            "agent_id": self.agent_id,
+            "context_id": self.context_id,
+        })
+        self._json_api_key_headers = MappingProxyType({
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+        })
+        self._invoke_headers = MappingProxyType({
+            "Accept": "application/json, text/event-stream",
+            "Content-Type": "application/json",
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "X-API-Key": self.api_key,
+        })
+
         self.proxy_endpoints = proxy_endpoints or {}
+        # Fully-formed request URLs, resolved once. Per-MCP /invoke URLs
+        # start from proxy_endpoints and are filled in on first use from
+        # <MCP>_PROXY_URL or the default proxy (see _invoke_url).
+        self._invoke_urls: Dict[str, str] = {
+            mcp: f"{url}/invoke" for mcp, url in self.proxy_endpoints.items()
+        }
+        self._token_url = f"{self.backend_endpoint}/iap/sdk/token"
+        self._token_batch_url = f"{self._token_url}/batch"
+        # None until the first batch request tells us whether the backend
+        # serves the batch endpoint; see get_intent_tokens_batch.
+        self._supports_batch: Optional[bool] = None
+        self._delegate_url = f"{self.backend_endpoint}/iap/trust/delegate"
         self.timeout = timeout
         self.max_retries = max_retries
         self.verify_ssl = verify_ssl
@@ -208,15 +338,55 @@ class ArmorIQClient:
             "Authorization": f"Bearer {self.api_key}",
         }
 
+        # The client is thread-safe; share one instance across threads so
+        # keep-alive (and HTTP/2 multiplexing, when h2 is installed) amortises
+        # the TLS handshake over every IAP/backend/proxy call. Pool settings go
+        # to httpx.Client itself, not a hand-built transport, so HTTP(S)_PROXY
+        # and NO_PROXY from the environment keep applying.
+        # Several clients (e.g. one per agent) can share one connection pool by
+        # passing the same ``transport``; its owner closes it, not close(), and
+        # it owns its own http2/verify/limits settings.
+        # prefer_h2=False pins HTTP/1.1 for proxies that mishandle h2.
+        self._http2 = HAS_H2 and prefer_h2
+        self._owns_transport = transport is None
+        client_kwargs: Dict[str, Any] = {}
+        if transport is not None:
+            client_kwargs["transport"] = transport
         self.http_client = httpx.Client(
             timeout=timeout,
-            verify=verify_ssl,
             headers=headers,
             follow_redirects=True,
+            http2=self._http2,
+            verify=verify_ssl,
+            limits=_POOL_LIMITS,
+            **client_kwargs,
         )
 
-        self._token_cache: Dict[str, IntentToken] = {}
+        # get_intent_token() reuses a live token for the same (plan, policy,
+        # validity); cache_tokens=False mints a fresh one on every call.
+        self.cache_tokens = cache_tokens
+        self._token_cache: TokenCache = TokenCache(maxsize=self.TOKEN_CACHE_SIZE)
+        # Within this many seconds of the serving floor (see MIN_TOKEN_SHARE)
+        # cached tokens are still returned, but a replacement is minted in the
+        # background (0 disables refresh-ahead).
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        # id(raw_token) -> (raw_token, snapshot of the encoded inputs, encoded
+        # fragments, per-action CSRG headers); see _token_wire.
+        self._wire_cache: LRUCache[int, Tuple[Any, ...]] = LRUCache(256)
         self._metadata_cache: Dict[str, MCPSemanticMetadata] = {}
+        # (parent token_id, delegate key, allowed actions, target agent) ->
+        # DelegationResult; see _delegation_key.
+        self._delegation_cache: LRUCache[Tuple[Any, ...], DelegationResult] = LRUCache(256)
+        # Per-MCP breaker: after N consecutive 5xx/transport failures, invoke()
+        # fails fast instead of spending a round trip on a proxy known to be
+        # down (threshold 0 disables).
+        self._circuit = CircuitBreaker(
+            threshold=circuit_breaker_threshold,
+            reset_after=circuit_breaker_reset_seconds,
+        )
         self._mcp_credentials: Dict[str, Dict[str, Any]] = self._resolve_mcp_credentials(
             mcp_credentials
         )
@@ -234,6 +404,11 @@ class ArmorIQClient:
         if not _skip_api_key_validation:
             self._validate_api_key()
 
+        if preconnect:
+            threading.Thread(
+                target=self.warmup, name="armoriq-warmup", daemon=True
+            ).start()
+
     # ─── Retry helpers ─────────────────────────────────────────────────
     # Apply exponential backoff (1s → 4s capped) on 5xx and network errors.
     # 4xx responses are passed through unchanged — caller decides how to
@@ -249,12 +424,14 @@ class ArmorIQClient:
         url: str,
         *,
         json: Any = None,
-        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[float] = None,
         idempotency_key: Optional[str] = None,
     ) -> "httpx.Response":
         """POST with exponential backoff. Reuses the same Idempotency-Key
-        across retries so the backend can dedupe on its side."""
+        across retries so the backend can dedupe on its side. Hot paths
+        pass a pre-encoded ``content`` body instead of ``json``."""
         merged_headers = dict(headers or {})
         if idempotency_key and "Idempotency-Key" not in merged_headers:
             merged_headers["Idempotency-Key"] = idempotency_key
@@ -267,6 +444,7 @@ class ArmorIQClient:
                 response = self.http_client.post(
                     url,
                     json=json,
+                    content=content,
                     headers=merged_headers,
                     timeout=timeout if timeout is not None else self.timeout,
                 )
@@ -361,6 +539,14 @@ class ArmorIQClient:
         if cache is not None:
             cache.pop(user_email.strip().lower(), None)
 
+    def invalidate_token(self, plan_hash: str) -> None:
+        """Drop cached intent tokens minted for ``plan_hash``."""
+        self._token_cache.invalidate(plan_hash)
+
+    def invalidate_all_tokens(self) -> None:
+        """Drop every cached intent token."""
+        self._token_cache.invalidate_all()
+
     def for_user(self, user_email: str) -> "ArmorIQUserScope":
         """
         Return a user-scoped helper. All enforcement / token minting /
@@ -494,6 +680,27 @@ class ArmorIQClient:
         except Exception as e:
             logger.warning("API key validation check failed: %s, but continuing...", e)
 
+    def warmup(self) -> None:
+        """
+        Open pooled connections to the backend and every configured proxy.
+
+        Sends one ``HEAD /health`` per distinct endpoint so the TLS handshake
+        is paid here rather than on the first token request or invoke().
+        Failures are ignored. Runs in a background thread when the client is
+        built with ``preconnect=True``.
+        """
+        for endpoint in self._warmup_endpoints():
+            try:
+                self.http_client.head(f"{endpoint}/health", timeout=2.0)
+            except Exception as e:
+                logger.debug("Warmup request to %s failed: %s", endpoint, e)
+
+    def _warmup_endpoints(self) -> List[str]:
+        """Distinct backend and proxy base URLs, in first-seen order."""
+        return list(dict.fromkeys(
+            [self.backend_endpoint, self.default_proxy_endpoint, *self.proxy_endpoints.values()]
+        ))
+
     def __enter__(self):
         return self
 
@@ -530,10 +737,13 @@ class ArmorIQClient:
 
     def close(self) -> None:
         """Close HTTP client and cleanup resources."""
-        try:
-            self.http_client.close()
-        except Exception:
-            pass
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+        if self._owns_transport:
+            try:
+                self.http_client.close()
+            except Exception:
+                pass
         logger.debug("ArmorIQ SDK client closed")
 
     # ─── Plan / Token ──────────────────────────────────────────────────
@@ -546,7 +756,7 @@ class ArmorIQClient:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> PlanCapture:
         """Capture an execution plan structure."""
-        logger.info("Capturing plan: llm=%s, prompt=%s...", llm, prompt[:50])
+        logger.info("Capturing plan: llm=%s, prompt=%.50s...", llm, prompt)
 
         if plan is None:
             raise ValueError(
@@ -564,7 +774,8 @@ class ArmorIQClient:
             prompt=prompt,
             metadata=metadata or {},
         )
-        logger.info("Plan captured with %d steps", len(plan.get("steps", [])))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Plan captured with %d steps", len(plan.get("steps", [])))
         return capture
 
     def get_intent_token(
@@ -574,143 +785,383 @@ class ArmorIQClient:
         validity_seconds: float = 60.0,
     ) -> IntentToken:
         """Request a signed intent token from IAP for the given plan."""
-        logger.info(
-            "Requesting intent token for plan with %d steps",
-            len(plan_capture.plan.get("steps", [])),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Requesting intent token for plan with %d steps",
+                len(plan_capture.plan.get("steps", [])),
+            )
 
-        payload: Dict[str, Any] = {
-            "user_id": self.user_id,
-            "agent_id": self.agent_id,
-            "context_id": self.context_id,
-            "plan": plan_capture.plan,
-            "policy": policy,
-            "expires_in": validity_seconds,
-        }
-        if self.user_email_override:
-            payload["user_email"] = self.user_email_override
+        cache_key = self._token_cache_key(plan_capture, policy, validity_seconds)
+        payload = self._token_payload(plan_capture, policy, validity_seconds)
+        if cache_key is not None:
+            cached = self._cached_token(cache_key, validity_seconds)
+            if cached is not None:
+                logger.debug("Reusing cached intent token %s", cached.token_id)
+                if self._claim_refresh(cache_key, cached, validity_seconds):
+                    self._refresh_pool().submit(
+                        self._refresh_token,
+                        cache_key, payload, plan_capture, policy, validity_seconds,
+                    )
+                return cached
 
+        token = self._issue_token(payload, plan_capture, policy, validity_seconds)
+        if cache_key is not None:
+            self._token_cache.put(cache_key, token)
+        return token
+
+    def get_intent_tokens_batch(
+        self,
+        plan_captures: Sequence[PlanCapture],
+        policy: Optional[Dict[str, Any]] = None,
+        validity_seconds: float = 60.0,
+        max_concurrent: int = 8,
+    ) -> List[IntentToken]:
+        """
+        Request intent tokens for several plans in one round trip.
+
+        Cached tokens are reused; the rest are minted with a single POST to
+        the backend's batch endpoint. If the backend doesn't serve it (404/
+        405, remembered for the life of the client), the tokens are minted
+        with concurrent per-plan requests instead, at most
+        ``max_concurrent`` at a time.
+
+        Returns:
+            Tokens in the order of ``plan_captures``. The first failure is
+            raised, as with get_intent_token().
+        """
+        tokens, keys, misses = self._cached_tokens(plan_captures, policy, validity_seconds)
+        if not misses:
+            return tokens  # type: ignore[return-value]
+
+        pending = [plan_captures[i] for i in misses]
+        payloads = [self._token_payload(pc, policy, validity_seconds) for pc in pending]
+        issued: Optional[List[IntentToken]] = None
+        if self._supports_batch is not False:
+            try:
+                response = self._retry_post(
+                    self._token_batch_url,
+                    content=_json_dumps({"batch": payloads}),
+                    headers=self._json_api_key_headers,
+                    timeout=30.0,
+                    idempotency_key=secrets.token_hex(16),
+                )
+            except Exception as e:
+                raise InvalidTokenException(f"Failed to get intent tokens: {e}")
+            issued = self._tokens_from_batch_response(
+                response, pending, policy, validity_seconds
+            )
+        if issued is None:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_concurrent, len(pending))),
+                thread_name_prefix="armoriq-token",
+            ) as pool:
+                issued = list(
+                    pool.map(
+                        self._issue_token,
+                        payloads,
+                        pending,
+                        [policy] * len(pending),
+                        [validity_seconds] * len(pending),
+                    )
+                )
+
+        for i, token in zip(misses, issued):
+            tokens[i] = token
+            if keys[i] is not None:
+                self._token_cache.put(keys[i], token)
+        return tokens  # type: ignore[return-value]
+
+    def _issue_token(
+        self,
+        payload: Dict[str, Any],
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> IntentToken:
         try:
             # Token issuance is idempotent on the backend (planHash-keyed),
             # so retrying a 5xx with the same Idempotency-Key is safe.
             response = self._retry_post(
-                f"{self.backend_endpoint}/iap/sdk/token",
-                json=payload,
-                headers={"X-API-Key": self.api_key},
+                self._token_url,
+                content=_json_dumps(payload),
+                headers=self._json_api_key_headers,
                 timeout=30.0,
                 idempotency_key=secrets.token_hex(16),
             )
+            return self._token_from_response(response, plan_capture, policy, validity_seconds)
 
-            if response.status_code >= 400:
-                response_data: Any
-                try:
-                    response_data = response.json()
-                except Exception:
-                    response_data = {"message": response.text}
-                denied_tools = (
-                    response_data.get("policy_validation", {}).get("denied_tools")
-                    if isinstance(response_data, dict)
-                    else None
+        except (InvalidTokenException, PolicyBlockedException):
+            raise
+        except httpx.HTTPStatusError as e:
+            raise InvalidTokenException(
+                f"Failed to get intent token: {_error_detail(e.response)}"
+            )
+        except Exception as e:
+            raise InvalidTokenException(f"Failed to get intent token: {e}")
+
+    def _refresh_pool(self) -> ThreadPoolExecutor:
+        """The refresh-ahead executor, created on first use (under the lock,
+        so concurrent callers share one)."""
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="armoriq-token-refresh"
                 )
-                denied_reasons = (
-                    response_data.get("policy_validation", {}).get("denied_reasons")
+            return self._refresh_executor
+
+    def _serving_floor(self, validity_seconds: float) -> float:
+        """Least remaining lifetime a cached token needs to be served for a
+        request of ``validity_seconds``."""
+        return max(self.MIN_TOKEN_LIFETIME, self.MIN_TOKEN_SHARE * validity_seconds)
+
+    def _cached_token(
+        self, cache_key: Tuple[Any, ...], validity_seconds: float
+    ) -> Optional[IntentToken]:
+        """Cached token for ``cache_key`` if it still has a meaningful share
+        of ``validity_seconds`` left (see _serving_floor), else None."""
+        token = self._token_cache.get(cache_key)
+        if token is None or token.time_until_expiry < self._serving_floor(validity_seconds):
+            return None
+        return token
+
+    def _claim_refresh(
+        self, cache_key: Tuple[Any, ...], token: IntentToken, validity_seconds: float
+    ) -> bool:
+        """True if ``token`` is within refresh_ahead_seconds of the serving
+        floor and no refresh for ``cache_key`` is already in flight (the
+        caller must then run one)."""
+        due = self._serving_floor(validity_seconds) + self.refresh_ahead_seconds
+        if self.refresh_ahead_seconds <= 0 or token.time_until_expiry >= due:
+            return False
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return False
+            self._refreshing.add(cache_key)
+        return True
+
+    def _refresh_token(
+        self,
+        cache_key: Tuple[Any, ...],
+        payload: Dict[str, Any],
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> None:
+        try:
+            token = self._issue_token(payload, plan_capture, policy, validity_seconds)
+            self._token_cache.put(cache_key, token)
+        except Exception as e:
+            logger.debug("Background intent token refresh failed: %s", e)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+
+    # Request building / response parsing for get_intent_token() lives in
+    # these helpers so AsyncArmorIQClient can share them over its own transport.
+
+    def _token_cache_key(
+        self,
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> Optional[Tuple[bytes, float, Optional[str]]]:
+        """
+        Token-cache key: a 16-byte digest of (plan, policy) plus the
+        validity window and user override. A fixed-size bytes/tuple key
+        keeps every cache probe O(1). None for plans that aren't plain
+        JSON, which are then never cached, and when cache_tokens is off.
+        """
+        if not self.cache_tokens:
+            return None
+        try:
+            body = json.dumps(
+                [plan_capture.plan, policy], sort_keys=True, separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).digest()
+        return (digest, validity_seconds, self.user_email_override)
+
+    def _cached_tokens(
+        self,
+        plan_captures: Sequence[PlanCapture],
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> Tuple[List[Optional[IntentToken]], List[Optional[Tuple[Any, ...]]], List[int]]:
+        """Cache lookups for a batch: ``(tokens, cache keys, miss indices)``,
+        with None in ``tokens`` at each miss."""
+        tokens: List[Optional[IntentToken]] = []
+        keys: List[Optional[Tuple[Any, ...]]] = []
+        misses: List[int] = []
+        for i, plan_capture in enumerate(plan_captures):
+            key = self._token_cache_key(plan_capture, policy, validity_seconds)
+            cached = self._cached_token(key, validity_seconds) if key is not None else None
+            if cached is None:
+                misses.append(i)
+            tokens.append(cached)
+            keys.append(key)
+        return tokens, keys, misses
+
+    def _tokens_from_batch_response(
+        self,
+        response: httpx.Response,
+        plan_captures: Sequence[PlanCapture],
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> Optional[List[IntentToken]]:
+        """Parse a ``{"tokens": [...]}`` batch response (each entry shaped like
+        a single token response). None if the backend has no batch endpoint."""
+        if response.status_code in (404, 405):
+            logger.debug("Batch token endpoint unavailable; minting tokens per plan")
+            self._supports_batch = False
+            return None
+        if response.status_code >= 400:
+            self._raise_token_error(response)
+        self._supports_batch = True
+        entries = _json_loads(response.content).get("tokens")
+        if not isinstance(entries, list) or len(entries) != len(plan_captures):
+            raise InvalidTokenException(
+                f"Token issuance failed: expected {len(plan_captures)} tokens in batch response"
+            )
+        return [
+            self._token_from_data(entry, plan_capture, policy, validity_seconds)
+            for entry, plan_capture in zip(entries, plan_captures)
+        ]
+
+    def _token_payload(
+        self,
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            **self._identity,
+            "plan": plan_capture.plan,
+            "policy": policy,
+            "expires_in": validity_seconds,
+        }
+        if self.user_email_override:
+            payload["user_email"] = self.user_email_override
+        return payload
+
+    def _token_from_response(
+        self,
+        response: httpx.Response,
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> IntentToken:
+        if response.status_code >= 400:
+            self._raise_token_error(response)
+        return self._token_from_data(
+            _json_loads(response.content), plan_capture, policy, validity_seconds
+        )
+
+    @staticmethod
+    def _raise_token_error(response: httpx.Response) -> NoReturn:
+        """Map a >=400 token-issuance response to PolicyBlocked/InvalidToken."""
+        response_data = _error_detail(response)
+        if isinstance(response_data, str):
+            response_data = {"message": response_data}
+        denied_tools = (
+            response_data.get("policy_validation", {}).get("denied_tools")
+            if isinstance(response_data, dict)
+            else None
+        )
+        denied_reasons = (
+            response_data.get("policy_validation", {}).get("denied_reasons")
+            if isinstance(response_data, dict)
+            else None
+        )
+        if response.status_code == 403 or (
+            isinstance(denied_tools, list) and len(denied_tools) > 0
+        ):
+            reason = (
+                "; ".join(denied_reasons)
+                if isinstance(denied_reasons, list) and denied_reasons
+                else (
+                    response_data.get("message")
                     if isinstance(response_data, dict)
                     else None
                 )
-                if response.status_code == 403 or (
-                    isinstance(denied_tools, list) and len(denied_tools) > 0
-                ):
-                    reason = (
-                        "; ".join(denied_reasons)
-                        if isinstance(denied_reasons, list) and denied_reasons
-                        else (
-                            response_data.get("message")
-                            if isinstance(response_data, dict)
-                            else None
-                        )
-                    ) or "Blocked by policy"
-                    raise PolicyBlockedException(
-                        f"Policy blocked intent token issuance: {reason}",
-                        enforcement_action=(
-                            response_data.get("policy_validation", {}).get(
-                                "default_enforcement_action"
-                            )
-                            if isinstance(response_data, dict)
-                            else None
-                        ),
-                        reason=reason,
-                        metadata=(
-                            response_data.get("policy_validation")
-                            if isinstance(response_data, dict)
-                            else None
-                        ),
+            ) or "Blocked by policy"
+            raise PolicyBlockedException(
+                f"Policy blocked intent token issuance: {reason}",
+                enforcement_action=(
+                    response_data.get("policy_validation", {}).get(
+                        "default_enforcement_action"
                     )
-                message = (
-                    response_data.get("message")
                     if isinstance(response_data, dict)
-                    else str(response_data)
-                )
-                raise InvalidTokenException(f"Token issuance failed: {message}")
+                    else None
+                ),
+                reason=reason,
+                metadata=(
+                    response_data.get("policy_validation")
+                    if isinstance(response_data, dict)
+                    else None
+                ),
+            )
+        message = (
+            response_data.get("message")
+            if isinstance(response_data, dict)
+            else str(response_data)
+        )
+        raise InvalidTokenException(f"Token issuance failed: {message}")
 
-            data = response.json()
-            if not data.get("success"):
-                raise InvalidTokenException(
-                    f"Token issuance failed: {data.get('message', 'Unknown error')}"
-                )
+    def _token_from_data(
+        self,
+        data: Dict[str, Any],
+        plan_capture: PlanCapture,
+        policy: Optional[Dict[str, Any]],
+        validity_seconds: float,
+    ) -> IntentToken:
+        if not data.get("success"):
+            raise InvalidTokenException(
+                f"Token issuance failed: {data.get('message', 'Unknown error')}"
+            )
 
-            token_data = data.get("token", {}) or {}
-            raw_token = {
-                "plan": plan_capture.plan,
-                "plan_id": data.get("plan_id"),
-                "token": token_data,
-                "plan_hash": data.get("plan_hash"),
-                "merkle_root": data.get("merkle_root"),
-                "intent_reference": data.get("intent_reference"),
-                "composite_identity": data.get("composite_identity", ""),
-                "step_proofs": data.get("step_proofs", []),
-            }
+        token_data = data.get("token", {}) or {}
+        raw_token = {
+            "plan": plan_capture.plan,
+            "plan_id": data.get("plan_id"),
+            "token": token_data,
+            "plan_hash": data.get("plan_hash"),
+            "merkle_root": data.get("merkle_root"),
+            "intent_reference": data.get("intent_reference"),
+            "composite_identity": data.get("composite_identity", ""),
+            "step_proofs": data.get("step_proofs", []),
+        }
 
-            now = datetime.now().timestamp()
-            token = IntentToken(
-                token_id=data.get("intent_reference") or "unknown",
-                plan_hash=data.get("plan_hash", ""),
-                plan_id=data.get("plan_id"),
-                signature=token_data.get("signature", "") if isinstance(token_data, dict) else "",
-                # Prefer the server-signed timestamps so expiry doesn't depend on
-                # the client's clock at mint time (fall back to local only if absent).
-                issued_at=(token_data.get("issued_at") if isinstance(token_data, dict) else None) or now,
-                expires_at=(token_data.get("expires_at") if isinstance(token_data, dict) else None) or (now + validity_seconds),
-                policy=policy or {},
-                composite_identity=data.get("composite_identity", ""),
-                client_info=data.get("client_info"),
-                policy_validation=data.get("policy_validation"),
-                step_proofs=data.get("step_proofs", []),
-                total_steps=len(plan_capture.plan.get("steps", [])),
-                raw_token=raw_token,
-                jwt_token=data.get("jwt_token"),
-                policy_snapshot=data.get("policy_snapshot"),
-            )
+        now = time.time()
+        token = IntentToken(
+            token_id=data.get("intent_reference") or "unknown",
+            plan_hash=data.get("plan_hash", ""),
+            plan_id=data.get("plan_id"),
+            signature=token_data.get("signature", "") if isinstance(token_data, dict) else "",
+            # Prefer the server-signed timestamps so expiry doesn't depend on
+            # the client's clock at mint time (fall back to local only if absent).
+            issued_at=(token_data.get("issued_at") if isinstance(token_data, dict) else None) or now,
+            expires_at=(token_data.get("expires_at") if isinstance(token_data, dict) else None) or (now + validity_seconds),
+            policy=policy or {},
+            composite_identity=data.get("composite_identity", ""),
+            client_info=data.get("client_info"),
+            policy_validation=data.get("policy_validation"),
+            step_proofs=data.get("step_proofs", []),
+            total_steps=len(plan_capture.plan.get("steps", [])),
+            raw_token=raw_token,
+            jwt_token=data.get("jwt_token"),
+            policy_snapshot=data.get("policy_snapshot"),
+        )
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "Intent token issued: id=%s, plan_hash=%s..., expires=%.1fs, stepProofs=%d",
+                "Intent token issued: id=%s, plan_hash=%.16s..., expires=%.1fs, stepProofs=%d",
                 token.token_id,
-                token.plan_hash[:16],
+                token.plan_hash,
                 token.time_until_expiry,
                 len(token.step_proofs or []),
             )
-            # Cache by plan_hash for idempotency on repeated mints within validity
-            if token.plan_hash:
-                self._token_cache[token.plan_hash] = token
-            return token
-
-        except (InvalidTokenException, PolicyBlockedException):
-            raise
-        except httpx.HTTPStatusError as e:
-            raise InvalidTokenException(
-                f"Failed to get intent token: {e.response.text}"
-            )
-        except Exception as e:
-            raise InvalidTokenException(f"Failed to get intent token: {e}")
+        return token
 
     # ─── MCP invocation ────────────────────────────────────────────────
 
@@ -725,7 +1176,62 @@ class ArmorIQClient:
     ) -> MCPInvocationResult:
         """Invoke an MCP action through the ArmorIQ proxy with token verification."""
         logger.info("Invoking MCP action: mcp=%s, action=%s", mcp, action)
+        url, body, headers = self._build_invoke_request(
+            mcp, action, intent_token, params, merkle_proof, user_email
+        )
+        self._check_circuit(mcp, action)
+        try:
+            start = time.perf_counter()
+            response = self.http_client.post(url, content=body, headers=headers)
+            self._record_circuit(mcp, response.status_code)
+            return self._invoke_result(response, mcp, action, intent_token, time.perf_counter() - start)
+
+        except (
+            MCPInvocationException,
+            IntentMismatchException,
+            InvalidTokenException,
+            PolicyBlockedException,
+            PolicyHoldException,
+        ):
+            raise
+        except httpx.HTTPStatusError as e:
+            self._raise_http_error(e.response, mcp, action, intent_token)
+        except Exception as e:
+            if isinstance(e, httpx.TransportError):
+                self._circuit.record_failure(mcp)
+            raise MCPInvocationException(
+                f"MCP invocation failed: {e}", mcp=mcp, action=action
+            )
+
+    def _check_circuit(self, mcp: str, action: str) -> None:
+        if not self._circuit.allow(mcp):
+            raise MCPInvocationException(
+                f"Circuit open for MCP '{mcp}' after repeated failures; "
+                f"next attempt in {self._circuit.retry_in(mcp):.1f}s",
+                mcp=mcp,
+                action=action,
+            )
 
+    def _record_circuit(self, mcp: str, status_code: int) -> None:
+        if status_code >= 500:
+            self._circuit.record_failure(mcp)
+        else:
+            self._circuit.record_success(mcp)
+
+    # Request building / response parsing for invoke(), shared with
+    # AsyncArmorIQClient.
+
+    def _build_invoke_request(
+        self,
+        mcp: str,
+        action: str,
+        intent_token: IntentToken,
+        params: Optional[Dict[str, Any]],
+        merkle_proof: Optional[List[Any]],
+        user_email: Optional[str],
+    ) -> Tuple[str, bytes, Dict[str, str]]:
+        """Return ``(url, body, headers)`` for a proxy ``/invoke`` call."""
+        user_email = user_email or self.user_email
         if intent_token.is_expired:
             raise TokenExpiredException(
                 f"Intent token expired {abs(intent_token.time_until_expiry):.1f}s ago",
@@ -733,12 +1239,6 @@ class ArmorIQClient:
                 expired_at=intent_token.expires_at,
             )
 
-        proxy_url = (
-            self.proxy_endpoints.get(mcp)
-            or os.getenv(f"{mcp.upper()}_PROXY_URL")
-            or self.default_proxy_endpoint
-        )
-
         iam_context: Dict[str, Any] = {}
         if intent_token.policy_validation:
             iam_context["allowed_tools"] = intent_token.policy_validation.get(
@@ -759,12 +1259,7 @@ class ArmorIQClient:
             "tool": action,
             "params": invoke_params,
             "arguments": invoke_params,
-            "intent_token": {
-                **(intent_token.raw_token or {}),
-                "policy_validation": intent_token.policy_validation,
-            },
             "merkle_proof": merkle_proof,
-            "plan": intent_token.raw_token.get("plan") if intent_token.raw_token else None,
             "_iam_context": iam_context,
         }
         if user_email:
@@ -773,64 +1268,36 @@ class ArmorIQClient:
             payload["policy_snapshot"] = intent_token.policy_snapshot
 
         headers: Dict[str, str] = {
-            "Accept": "application/json, text/event-stream",
-            "Content-Type": "application/json",
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "X-Request-ID": f"sdk-{int(datetime.now().timestamp() * 1000)}",
-            "X-API-Key": self.api_key,
+            **self._invoke_headers,
+            "X-Request-ID": f"sdk-{int(time.time() * 1000)}",
         }
 
         cred = self._get_mcp_credential(mcp)
         if cred:
             headers["X-Armoriq-MCP-Auth"] = self._encode_mcp_auth_header(cred)
 
-        if intent_token.raw_token and isinstance(intent_token.raw_token, dict):
-            payload["token"] = intent_token.raw_token.get("token", {})
-            payload["csrg_token"] = intent_token.raw_token.get("token", {})
-
-        plan = intent_token.raw_token.get("plan", {}) if intent_token.raw_token else {}
-        steps = plan.get("steps", [])
-
-        step_index: Optional[int] = None
-        for idx, step in enumerate(steps):
-            if isinstance(step, dict) and step.get("action") == action:
-                step_index = idx
-                break
-
-        if step_index is None:
-            actions = [
-                s.get("action") if isinstance(s, dict) else "unknown" for s in steps
-            ]
-            raise IntentMismatchException(
-                f"Action '{action}' not found in the original plan. "
-                f"Plan contains actions: {actions}. "
-                "You can only invoke actions that were included in the plan "
-                "when you called capture_plan()."
-            )
+        fragments, step_wire = self._token_wire(intent_token)
+        wire = step_wire.get(action)
+        if wire is None:
+            wire = step_wire[action] = self._step_wire(intent_token, action)
+        step_index, proof_header, value_digest = wire
 
         # Fail closed: refuse to invoke without an inclusion proof rather than
         # sending an unproven request and relying on the proxy to reject it.
-        if not merkle_proof:
-            if intent_token.step_proofs and len(intent_token.step_proofs) > step_index:
-                merkle_proof = intent_token.step_proofs[step_index]
-                logger.debug("Using Merkle proof from CSRG-IAP for step %s", step_index)
-            else:
-                raise MCPInvocationException(
-                    f"No CSRG Merkle proof available for step {step_index} "
-                    f"(step_proofs length: {len(intent_token.step_proofs or [])}). "
-                    "Refusing to invoke without an inclusion proof (fail-closed)."
-                )
-
-        headers["X-CSRG-Proof"] = json.dumps(merkle_proof, separators=(",", ":"))
+        if merkle_proof:
+            proof_header = json.dumps(merkle_proof, separators=(",", ":"))
+        elif proof_header is None:
+            raise MCPInvocationException(
+                f"No CSRG Merkle proof available for step {step_index} "
+                f"(step_proofs length: {len(intent_token.step_proofs or [])}). "
+                "Refusing to invoke without an inclusion proof (fail-closed)."
+            )
+        else:
+            logger.debug("Using Merkle proof from CSRG-IAP for step %s", step_index)
 
+        headers["X-CSRG-Proof"] = proof_header
         headers["X-CSRG-Path"] = f"/steps/[{step_index}]/action"
-
-        step_obj = steps[step_index] if step_index < len(steps) else {}
-        leaf_value = step_obj.get("action", action) if isinstance(step_obj, dict) else action
-        value_str = json.dumps(leaf_value, separators=(",", ":"))
-        headers["X-CSRG-Value-Digest"] = hashlib.sha256(
-            value_str.encode("utf-8")
-        ).hexdigest()
+        headers["X-CSRG-Value-Digest"] = value_digest
 
         # Subtree delegation envelope: when this token was minted by
         # delegate_subtree(), attach the inclusion proof + subtree root so the
@@ -850,51 +1317,129 @@ class ArmorIQClient:
                     proof_json.encode("utf-8")
                 ).decode("ascii")
 
-        try:
-            start = time.time()
-            response = self.http_client.post(
-                f"{proxy_url}/invoke", json=payload, headers=headers
+        # intent_token / plan / token / csrg_token are spliced in pre-encoded.
+        body = _json_dumps_object(payload, fragments)
+        return self._invoke_url(mcp), body, headers
+
+    def _token_fragments(self, intent_token: IntentToken) -> Dict[str, bytes]:
+        return self._token_wire(intent_token)[0]
+
+    def _token_wire(
+        self, intent_token: IntentToken
+    ) -> Tuple[Dict[str, bytes], Dict[str, Tuple[int, Optional[str], str]]]:
+        """
+        Per-token wire state that every invoke() would otherwise rebuild:
+
+        - JSON-encoded copies of the token parts spliced into the body. The
+          raw token (plan, step proofs, signed payload) is the bulk of the
+          body, so it is encoded once per token rather than per call.
+        - action -> (step index, X-CSRG-Proof, X-CSRG-Value-Digest), filled
+          in by _build_invoke_request on first use of each action.
+
+        Entries are keyed by id(raw_token) and hold a reference to it, so an
+        id is never reused while its entry is alive. Callers may edit
+        raw_token, step_proofs or policy_validation in place, so each entry
+        also keeps a deep copy of those inputs and is only reused while the
+        token still compares equal to it; comparing is far cheaper than
+        re-encoding.
+        """
+        raw = intent_token.raw_token
+        inputs = (raw, intent_token.policy_validation, intent_token.step_proofs)
+        hit = self._wire_cache.get(id(raw))
+        if hit is not None and hit[0] is raw and hit[1] == inputs:
+            return hit[2], hit[3]
+        fragments = {
+            "intent_token": _json_dumps(
+                {**(raw or {}), "policy_validation": intent_token.policy_validation}
+            ),
+            "plan": _json_dumps(raw.get("plan") if raw else None),
+        }
+        if raw:
+            fragments["token"] = fragments["csrg_token"] = _json_dumps(raw.get("token", {}))
+        step_wire: Dict[str, Tuple[int, Optional[str], str]] = {}
+        self._wire_cache.put(id(raw), (raw, copy.deepcopy(inputs), fragments, step_wire))
+        return fragments, step_wire
+
+    @staticmethod
+    def _step_wire(
+        intent_token: IntentToken, action: str
+    ) -> Tuple[int, Optional[str], str]:
+        """Locate ``action`` in the token's plan and encode its CSRG headers.
+        The proof is None when the token carries no proof for that step."""
+        plan = intent_token.raw_token.get("plan", {}) if intent_token.raw_token else {}
+        steps = plan.get("steps", [])
+
+        step_index: Optional[int] = None
+        for idx, step in enumerate(steps):
+            if isinstance(step, dict) and step.get("action") == action:
+                step_index = idx
+                break
+
+        if step_index is None:
+            actions = [
+                s.get("action") if isinstance(s, dict) else "unknown" for s in steps
+            ]
+            raise IntentMismatchException(
+                f"Action '{action}' not found in the original plan. "
+                f"Plan contains actions: {actions}. "
+                "You can only invoke actions that were included in the plan "
+                "when you called capture_plan()."
             )
-            execution_time = time.time() - start
 
-            try:
-                response_data: Any = response.json()
-            except Exception:
-                response_data = None
+        proof_header: Optional[str] = None
+        step_proofs = intent_token.step_proofs
+        if step_proofs and len(step_proofs) > step_index:
+            proof_header = json.dumps(step_proofs[step_index], separators=(",", ":"))
 
-            content_type = response.headers.get("content-type", "")
-            data: Dict[str, Any]
-            if "text/event-stream" in content_type and isinstance(response.text, str):
-                data = {}
-                for line in response.text.split("\n"):
-                    if line.startswith("data: "):
-                        try:
-                            data = json.loads(line[6:])
-                            break
-                        except json.JSONDecodeError:
-                            continue
-                if not data:
-                    raise MCPInvocationException(
-                        "No data in SSE response", mcp=mcp, action=action
-                    )
-            else:
-                data = response_data if isinstance(response_data, dict) else {}
+        leaf_value = steps[step_index].get("action", action)
+        value_digest = hashlib.sha256(
+            json.dumps(leaf_value, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+        return step_index, proof_header, value_digest
+
+    def _invoke_url(self, mcp: str) -> str:
+        url = self._invoke_urls.get(mcp)
+        if url is None:
+            proxy_url = (
+                self.proxy_endpoints.get(mcp)
+                or os.getenv(f"{mcp.upper()}_PROXY_URL")
+                or self.default_proxy_endpoint
+            )
+            url = self._invoke_urls[mcp] = f"{proxy_url}/invoke"
+        return url
+
+    def _invoke_result(
+        self,
+        response: httpx.Response,
+        mcp: str,
+        action: str,
+        intent_token: IntentToken,
+        execution_time: float,
+    ) -> MCPInvocationResult:
+        """Map a proxy ``/invoke`` response to a result or the matching exception."""
+        try:
+            media_type = response.headers.get("content-type", "").split(";", 1)[0].strip()
+            data = _PARSERS.get(media_type, _parse_json_body)(response.content)
+            if data is None:
+                raise MCPInvocationException(
+                    "No data in SSE response", mcp=mcp, action=action
+                )
 
             if isinstance(data, dict) and data.get("enforcement"):
                 raise _EnforcementResponse(data, response.status_code)
 
             if response.status_code >= 400:
-                self._raise_http_error(response, mcp, action, intent_token)
+                # Reuse the body parsed above rather than decoding it twice.
+                self._raise_http_error(response, mcp, action, intent_token, detail=data or None)
 
             if isinstance(data, dict) and data.get("error") and not data.get("enforcement"):
                 err = data["error"]
-                error_msg = err.get("message", "Unknown error")
-                error_code = err.get("code", -1)
-                error_data = err.get("data", "")
                 raise MCPInvocationException(
-                    f"MCP tool error ({error_code}): {error_msg} - {error_data}",
+                    err.get("message", "Unknown error"),
                     mcp=mcp,
                     action=action,
+                    code=err.get("code", -1),
+                    data=err.get("data", ""),
                 )
 
             result_data = data.get("result", data) if isinstance(data, dict) else data
@@ -934,34 +1479,21 @@ class ArmorIQClient:
                 delegation_context=env.data.get("delegation_context"),
                 metadata=enforcement.get("metadata"),
             )
-        except (
-            MCPInvocationException,
-            IntentMismatchException,
-            InvalidTokenException,
-            PolicyBlockedException,
-            PolicyHoldException,
-        ):
-            raise
-        except httpx.HTTPStatusError as e:
-            self._raise_http_error(e.response, mcp, action, intent_token)
-        except Exception as e:
-            raise MCPInvocationException(
-                f"MCP invocation failed: {e}", mcp=mcp, action=action
-            )
 
-    @staticmethod
     def _raise_http_error(
+        self,
         response: httpx.Response,
         mcp: str,
         action: str,
         intent_token: IntentToken,
+        detail: Any = None,
     ) -> None:
-        try:
-            detail: Any = response.json()
-        except Exception:
-            detail = response.text
+        if detail is None:
+            detail = _error_detail(response)
         status_code = response.status_code
         if status_code in (401, 403):
+            # The proxy rejected this token; don't hand it out again.
+            self._forget_token(intent_token)
             raise InvalidTokenException(f"Token verification failed: {detail}")
         if status_code == 409:
             raise IntentMismatchException(
@@ -976,6 +1508,50 @@ class ArmorIQClient:
             status_code=status_code,
         )
 
+    def invoke_batch(
+        self,
+        specs: Sequence[MCPInvocation],
+        max_concurrent: int = 8,
+        fail_fast: bool = False,
+    ) -> List[Union[MCPInvocationResult, Exception]]:
+        """
+        Invoke several MCP actions concurrently over the shared connection pool.
+
+        Results come back in the order of ``specs``; a failed call leaves its
+        exception in that slot. With ``fail_fast=True`` the first failure
+        cancels calls that have not started yet and is raised instead.
+        """
+        if not specs:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrent, len(specs))),
+            thread_name_prefix="armoriq-invoke",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.invoke,
+                    spec.mcp,
+                    spec.action,
+                    spec.intent_token,
+                    spec.params,
+                    spec.merkle_proof,
+                    (spec.iam_context or {}).get("email"),
+                )
+                for spec in specs
+            ]
+            if fail_fast:
+                done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in pending:
+                    future.cancel()
+                for future in futures:
+                    if future in done and future.exception() is not None:
+                        raise future.exception()  # type: ignore[misc]
+        results: List[Union[MCPInvocationResult, Exception]] = []
+        for future in futures:
+            exc = future.exception()
+            results.append(exc if exc is not None else future.result())  # type: ignore[arg-type]
+        return results
+
     # ─── Delegation (legacy CSRG path) ─────────────────────────────────
 
     def delegate(
@@ -987,92 +1563,194 @@ class ArmorIQClient:
         target_agent: Optional[str] = None,
         subtask: Optional[Dict[str, Any]] = None,
     ) -> DelegationResult:
-        """Delegate authority to another agent using CSRG token delegation."""
+        """
+        Delegate authority to another agent using CSRG token delegation.
+
+        Repeating a delegation (same parent token, delegate key, validity,
+        allowed actions and target agent, no subtask) returns the earlier result
+        while it has more than DELEGATION_REUSE_MARGIN seconds left.
+        """
+        cache_key = self._delegation_key(
+            intent_token, delegate_public_key, validity_seconds,
+            allowed_actions, target_agent, subtask,
+        )
+        cached = self._cached_delegation(cache_key)
+        if cached is not None:
+            return cached
+
         logger.info(
-            "Creating delegation for token_id=%s, delegate_key=%s..., validity=%ds",
+            "Creating delegation for token_id=%s, delegate_key=%.16s..., validity=%ds",
             intent_token.token_id,
-            delegate_public_key[:16],
+            delegate_public_key,
             validity_seconds,
         )
 
-        token_to_delegate: Any = intent_token.raw_token
-        if isinstance(token_to_delegate, dict) and "token" in token_to_delegate:
-            token_to_delegate = token_to_delegate["token"]
-
-        payload: Dict[str, Any] = {
-            "token": token_to_delegate,
-            "delegate_public_key": delegate_public_key,
-            "validity_seconds": validity_seconds,
-        }
-        if allowed_actions:
-            payload["allowed_actions"] = allowed_actions
-        if target_agent:
-            payload["target_agent"] = target_agent
-        if subtask:
-            payload["subtask"] = subtask
+        body = self._delegate_body(
+            intent_token, delegate_public_key, validity_seconds,
+            allowed_actions, target_agent, subtask,
+        )
 
         # NOTE: delegate() is legacy. Prefer delegate_subtree() for subtree-bounded
         # delegation. The /delegation/create route was removed; the live delegation
         # endpoint is /iap/trust/delegate on the backend.
         try:
             response = self.http_client.post(
-                f"{self.backend_endpoint}/iap/trust/delegate",
-                json=payload,
+                self._delegate_url,
+                content=body,
+                headers={"Content-Type": "application/json"},
                 timeout=10.0,
             )
-            if response.status_code >= 400:
-                raise DelegationException(
-                    f"Delegation failed: {response.text}",
-                    target_agent=target_agent,
-                    status_code=response.status_code,
-                )
-
-            data = response.json()
-            delegated_token_data = (
-                data.get("delegation") or data.get("delegated_token") or data.get("new_token")
-            )
-            if not delegated_token_data:
-                raise DelegationException(
-                    f"Delegation response missing 'delegation' key. Got keys: {list(data.keys())}",
-                    delegation_id=data.get("delegation_id"),
-                )
-
-            delegated_token = IntentToken(
-                token_id=delegated_token_data.get("token_id", ""),
-                plan_hash=delegated_token_data.get("plan_hash", intent_token.plan_hash),
-                plan_id=delegated_token_data.get("plan_id"),
-                signature=delegated_token_data.get("signature", ""),
-                issued_at=delegated_token_data.get("issued_at", datetime.now().timestamp()),
-                expires_at=delegated_token_data.get("expires_at", 0),
-                policy=delegated_token_data.get("policy", {}),
-                composite_identity=delegated_token_data.get("composite_identity", ""),
-                client_info=delegated_token_data.get("client_info"),
-                policy_validation=delegated_token_data.get("policy_validation"),
-                step_proofs=delegated_token_data.get("step_proofs", []),
-                total_steps=delegated_token_data.get("total_steps", 0),
-                raw_token={"token": delegated_token_data},
-            )
-
-            return DelegationResult(
-                delegation_id=data.get("delegation_id", delegated_token.token_id),
-                delegated_token=delegated_token,
-                delegate_public_key=delegate_public_key,
-                target_agent=target_agent,
-                expires_at=delegated_token.expires_at,
-                trust_delta=data.get("trust_delta", {}),
-                status="delegated",
-                metadata=data.get("metadata", {}),
+            result = self._delegation_from_response(
+                response, intent_token, delegate_public_key, target_agent
             )
         except DelegationException:
             raise
         except httpx.HTTPStatusError as e:
             raise DelegationException(
-                f"Delegation failed: {e.response.text}",
+                f"Delegation failed: {_error_detail(e.response)}",
                 target_agent=target_agent,
                 status_code=e.response.status_code,
             )
         except Exception as e:
             raise DelegationException(f"Delegation failed: {e}", target_agent=target_agent)
+        if cache_key is not None:
+            self._delegation_cache.put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _delegation_key(
+        intent_token: IntentToken,
+        delegate_public_key: str,
+        validity_seconds: int,
+        allowed_actions: Optional[List[str]],
+        target_agent: Optional[str],
+        subtask: Optional[Dict[str, Any]],
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Cache key for a delegate() call, or None when it shouldn't be reused.
+
+        The parent token is identified by its signature and plan hash, not
+        just token_id, which IAP responses may leave empty or "unknown".
+        Tokens without a signature are never cached.
+        """
+        if subtask or not intent_token.signature:
+            return None
+        if intent_token.token_id in ("", "unknown"):
+            return None
+        return (
+            intent_token.token_id,
+            intent_token.signature,
+            intent_token.plan_hash,
+            delegate_public_key,
+            validity_seconds,
+            tuple(sorted(allowed_actions or ())),
+            target_agent,
+        )
+
+    def _forget_token(self, intent_token: IntentToken) -> None:
+        """Drop a rejected or revoked token from the caches, together with
+        any cached delegation granted from it or holding it."""
+        signature = intent_token.signature
+
+        def same(token: IntentToken) -> bool:
+            return token is intent_token or bool(signature) and token.signature == signature
+
+        self._token_cache.discard_if(same)
+        self._delegation_cache.discard_items_if(
+            lambda key, d: same(d.delegated_token)
+            or (key[1], key[2]) == (signature, intent_token.plan_hash)
+        )
+
+    def _cached_delegation(
+        self, cache_key: Optional[Tuple[Any, ...]]
+    ) -> Optional[DelegationResult]:
+        if cache_key is None:
+            return None
+        cached = self._delegation_cache.get(cache_key)
+        if cached is None:
+            return None
+        if cached.expires_at - time.time() > self.DELEGATION_REUSE_MARGIN:
+            return cached
+        self._delegation_cache.pop(cache_key)
+        return None
+
+    def _delegate_body(
+        self,
+        intent_token: IntentToken,
+        delegate_public_key: str,
+        validity_seconds: int,
+        allowed_actions: Optional[List[str]],
+        target_agent: Optional[str],
+        subtask: Optional[Dict[str, Any]],
+    ) -> bytes:
+        raw = intent_token.raw_token
+        if isinstance(raw, dict) and "token" in raw:
+            token_json = self._token_fragments(intent_token)["token"]
+        else:
+            token_json = _json_dumps(raw)
+
+        payload: Dict[str, Any] = {
+            "delegate_public_key": delegate_public_key,
+            "validity_seconds": validity_seconds,
+        }
+        if allowed_actions:
+            payload["allowed_actions"] = allowed_actions
+        if target_agent:
+            payload["target_agent"] = target_agent
+        if subtask:
+            payload["subtask"] = subtask
+        return _json_dumps_object(payload, {"token": token_json})
+
+    @staticmethod
+    def _delegation_from_response(
+        response: httpx.Response,
+        intent_token: IntentToken,
+        delegate_public_key: str,
+        target_agent: Optional[str],
+    ) -> DelegationResult:
+        if response.status_code >= 400:
+            raise DelegationException(
+                f"Delegation failed: {_error_detail(response)}",
+                target_agent=target_agent,
+                status_code=response.status_code,
+            )
+
+        data = _json_loads(response.content)
+        delegated_token_data = (
+            data.get("delegation") or data.get("delegated_token") or data.get("new_token")
+        )
+        if not delegated_token_data:
+            raise DelegationException(
+                f"Delegation response missing 'delegation' key. Got keys: {list(data.keys())}",
+                delegation_id=data.get("delegation_id"),
+            )
+
+        delegated_token = IntentToken(
+            token_id=delegated_token_data.get("token_id", ""),
+            plan_hash=delegated_token_data.get("plan_hash", intent_token.plan_hash),
+            plan_id=delegated_token_data.get("plan_id"),
+            signature=delegated_token_data.get("signature", ""),
+            issued_at=delegated_token_data.get("issued_at", time.time()),
+            expires_at=delegated_token_data.get("expires_at", 0),
+            policy=delegated_token_data.get("policy", {}),
+            composite_identity=delegated_token_data.get("composite_identity", ""),
+            client_info=delegated_token_data.get("client_info"),
+            policy_validation=delegated_token_data.get("policy_validation"),
+            step_proofs=delegated_token_data.get("step_proofs", []),
+            total_steps=delegated_token_data.get("total_steps", 0),
+            raw_token={"token": delegated_token_data},
+        )
+
+        return DelegationResult(
+            delegation_id=data.get("delegation_id", delegated_token.token_id),
+            delegated_token=delegated_token,
+            delegate_public_key=delegate_public_key,
+            target_agent=target_agent,
+            expires_at=delegated_token.expires_at,
+            trust_delta=data.get("trust_delta", {}),
+            status="delegated",
+            metadata=data.get("metadata", {}),
+        )
 
     # -------------------- Trust update primitives --------------------
     # Thin client methods over conmap-auto's /iap/trust/* API. All fail closed.
@@ -1105,6 +1783,7 @@ class ArmorIQClient:
                     f"Revoke failed for {intent_token.token_id}: {response.text}",
                     status_code=response.status_code,
                 )
+            self._forget_token(intent_token)
             return response.json()
         except DelegationException:
             raise
@@ -1135,6 +1814,8 @@ class ArmorIQClient:
                     f"Reanchor failed for {intent_token.token_id}: {response.text}",
                     status_code=response.status_code,
                 )
+            # Tokens minted for the old plan no longer match it.
+            self._token_cache.invalidate(intent_token.plan_hash)
             return response.json()
         except DelegationException:
             raise
@@ -3,9 +3,15 @@
 canonical_json matches the IAP signer's
 json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True),
 so verify_ed25519 can recompute the exact bytes a token signature covers.
+
+verify_ed25519 memoises its result on the exact (key, message, signature)
+it checked, so re-verifying the same token (verify_token before each call,
+retries, delegation chains) skips the curve operation. A token whose signed
+fields were altered produces a different message and is checked afresh.
 """
 
 import json
+from functools import lru_cache
 from typing import Any, Mapping
 
 from cryptography.exceptions import InvalidSignature
@@ -44,6 +50,7 @@ def verify_intent_token_signature(raw_token: Any) -> bool:
     return verify_ed25519(public_key_hex, canonical_json(payload), signature_hex)
 
 
+@lru_cache(maxsize=1024)
 def verify_ed25519(public_key_hex: str, message: bytes, signature_hex: str) -> bool:
     """Verify a raw Ed25519 signature (hex) over message with a raw 32-byte
     public key (hex). Returns False on any malformed input or bad signature."""
@@ -64,6 +64,11 @@ class TokenExpiredException(InvalidTokenException):
         self.expired_at = expired_at
 
 
+# Default for MCPInvocationException(code=...): a JSON-RPC error may carry an
+# explicit ``"code": null``, so None cannot mean "not a tool error".
+_NO_CODE: Any = object()
+
+
 class MCPInvocationException(ArmorIQException):
     """
     Raised when an MCP action invocation fails.
@@ -73,19 +78,34 @@ class MCPInvocationException(ArmorIQException):
     - Action not found
     - Invalid parameters
     - Proxy verification failure
+
+    JSON-RPC tool errors pass ``code``/``data`` alongside ``message``; the
+    full "MCP tool error (...)" text is then only built when the exception
+    is actually rendered.
     """
 
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         mcp: Optional[str] = None,
         action: Optional[str] = None,
         status_code: Optional[int] = None,
+        code: Optional[Any] = _NO_CODE,
+        data: Any = "",
     ):
         super().__init__(message)
         self.mcp = mcp
         self.action = action
         self.status_code = status_code
+        self._tool_error = code is not _NO_CODE
+        self.error_code = code if self._tool_error else None
+        self.error_msg = message
+        self.error_data = data
+
+    def __str__(self) -> str:
+        if not self._tool_error:
+            return super().__str__()
+        return f"MCP tool error ({self.error_code}): {self.error_msg} - {self.error_data}"
 
 
 class DelegationException(ArmorIQException):
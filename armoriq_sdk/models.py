@@ -4,15 +4,25 @@ Pydantic models for ArmorIQ SDK data structures.
 Mirrors the TypeScript SDK models at parity. Field naming uses Python's
 ``snake_case`` at the API boundary; all TS interfaces have corresponding
 pydantic models here.
+
+Models that aren't on the per-call path (delegation, semantic metadata,
+credentials, config) set ``defer_build=True``: their validators are built
+on first use instead of at import.
 """
 
+from time import time as _time
 from typing import Any, Callable, Dict, List, Literal, Optional, Union
-from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
 
 class IntentToken(BaseModel):
-    """Represents a signed intent token from IAP."""
+    """
+    Represents a signed intent token from IAP.
+
+    Frozen, but the dict fields are shared, not copied: derive a modified
+    token with ``model_copy(update={...})`` and fresh dicts instead of
+    mutating ``raw_token`` in place.
+    """
 
     model_config = ConfigDict(frozen=True)
 
@@ -46,12 +56,12 @@ class IntentToken(BaseModel):
     @property
     def is_expired(self) -> bool:
         """Check if the token has expired."""
-        return datetime.now().timestamp() > self.expires_at
+        return _time() > self.expires_at
 
     @property
     def time_until_expiry(self) -> float:
         """Get seconds until token expiry (negative if expired)."""
-        return self.expires_at - datetime.now().timestamp()
+        return self.expires_at - _time()
 
 
 class PlanCapture(BaseModel):
@@ -99,6 +109,8 @@ class MCPInvocationResult(BaseModel):
 class DelegationRequest(BaseModel):
     """Request for delegating a subtask to another agent."""
 
+    model_config = ConfigDict(defer_build=True)
+
     target_agent: str = Field(..., description="Target agent identifier")
     subtask: Dict[str, Any] = Field(..., description="Subtask to delegate")
     intent_token: IntentToken = Field(..., description="Current intent token")
@@ -112,6 +124,8 @@ class DelegationRequest(BaseModel):
 class DelegationResult(BaseModel):
     """Result from a delegation request."""
 
+    model_config = ConfigDict(defer_build=True)
+
     delegation_id: str = Field(..., description="Delegation identifier")
     delegated_token: IntentToken = Field(..., description="Delegated intent token")
     delegate_public_key: str = Field(..., description="Public key of delegate")
@@ -138,7 +152,7 @@ class ToolSemanticEntry(BaseModel):
     recipient_field: Optional[str] = Field(None, alias="recipientField")
     category: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
 
 
 class MCPSemanticMetadata(BaseModel):
@@ -151,12 +165,14 @@ class MCPSemanticMetadata(BaseModel):
     )
     role_mapping: Dict[str, str] = Field(default_factory=dict, alias="roleMapping")
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
 
 
 class PolicyContext(BaseModel):
     """Policy context enriched from semantic metadata."""
 
+    model_config = ConfigDict(defer_build=True)
+
     is_financial: bool = False
     transaction_type: Optional[str] = None
     amount: Optional[float] = None
@@ -173,7 +189,7 @@ class HoldInfo(BaseModel):
     tool: str
     mcp: str
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class InvokeOptions(BaseModel):
@@ -186,7 +202,7 @@ class InvokeOptions(BaseModel):
     requester_role: Optional[str] = None
     requester_limit: Optional[float] = None
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
 
 class DelegationRequestParams(BaseModel):
@@ -206,7 +222,7 @@ class DelegationRequestParams(BaseModel):
     merkle_root: Optional[str] = Field(None, alias="merkleRoot")
     reason: Optional[str] = None
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class DelegationRequestResult(BaseModel):
@@ -216,7 +232,7 @@ class DelegationRequestResult(BaseModel):
     status: str
     expires_at: str = Field(..., alias="expiresAt")
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
 
 
 class ApprovedDelegation(BaseModel):
@@ -227,7 +243,7 @@ class ApprovedDelegation(BaseModel):
     approver_role: str = Field(..., alias="approverRole")
     delegation_token: Optional[str] = Field(None, alias="delegationToken")
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="allow", defer_build=True)
 
 
 class ToolCall(BaseModel):
@@ -244,26 +260,26 @@ class ToolCall(BaseModel):
 class _McpCredBearer(BaseModel):
     auth_type: Literal["bearer"] = Field("bearer", alias="authType")
     token: str
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class _McpCredApiKey(BaseModel):
     auth_type: Literal["api_key"] = Field("api_key", alias="authType")
     api_key: str = Field(..., alias="apiKey")
     header_name: Optional[str] = Field(None, alias="headerName")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class _McpCredBasic(BaseModel):
     auth_type: Literal["basic"] = Field("basic", alias="authType")
     username: str
     password: str
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class _McpCredNone(BaseModel):
     auth_type: Literal["none"] = Field("none", alias="authType")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 McpCredential = Union[_McpCredBearer, _McpCredApiKey, _McpCredBasic, _McpCredNone]
@@ -281,6 +297,8 @@ McpCredentialMap = Dict[str, McpCredential]
 class SDKConfig(BaseModel):
     """SDK configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     iap_endpoint: str = Field(..., description="IAP endpoint URL")
     proxy_endpoint: Optional[str] = Field(None, description="Default proxy endpoint")
     backend_endpoint: Optional[str] = Field(None, description="Backend endpoint")
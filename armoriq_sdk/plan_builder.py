@@ -90,8 +90,8 @@ def hash_tool_calls(
     produce matching digests.
     """
     canonical_list = [
-        {"name": _as_tool_call(tc).name, "args": _as_tool_call(tc).args or {}}
-        for tc in tool_calls
+        {"name": tc.name, "args": tc.args or {}}
+        for tc in map(_as_tool_call, tool_calls)
     ]
     canonical = json.dumps(
         canonical_list, sort_keys=True, separators=(",", ":"), ensure_ascii=True
@@ -19,6 +19,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Sequence, Union
 
 import httpx
@@ -484,7 +485,9 @@ class ArmorIQSession:
                     "delegated_by": o.delegated_by,
                     "user_email": user_email,
                     "delegated_to": o.delegated_to,
-                    "executed_at": __import__("datetime").datetime.utcnow().isoformat() + "Z",
+                    "executed_at": datetime.now(timezone.utc).strftime(
+                        "%Y-%m-%dT%H:%M:%S.%fZ"
+                    ),
                 },
                 headers={
                     "X-API-Key": self._client.api_key,
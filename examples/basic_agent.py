@@ -5,11 +5,16 @@ Demonstrates:
 - Client initialization
 - Plan capture
 - Token acquisition
-- MCP invocation
+- MCP invocation (independent calls batched concurrently)
 """
 
 import logging
-from armoriq_sdk import ArmorIQClient, InvalidTokenException, IntentMismatchException
+from armoriq_sdk import (
+    ArmorIQClient,
+    IntentMismatchException,
+    InvalidTokenException,
+    MCPInvocation,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -56,55 +61,49 @@ def main():
     print("\n🎬 Step 3: Invoke MCP Actions")
     print("=" * 60)
 
-    # Invoke travel MCP to book flight
-    try:
-        print("Booking flight via travel-mcp...")
-        flight_result = client.invoke(
-            mcp="travel-mcp",
-            action="book_flight",
-            intent_token=token,
-            params={
-                "origin": "SFO",
-                "destination": "CDG",
-                "date": "2026-02-15",
-                "passengers": 1,
-            },
-        )
-
-        print(f"✅ Flight booked!")
-        print(f"   Status: {flight_result.status}")
-        print(f"   Execution Time: {flight_result.execution_time:.2f}s")
-        print(f"   Result: {flight_result.result}")
-
-    except InvalidTokenException as e:
-        print(f"❌ Token validation failed: {e}")
-    except IntentMismatchException as e:
-        print(f"❌ Action not in plan: {e}")
-    except Exception as e:
-        print(f"❌ Invocation failed: {e}")
-
-    # Invoke travel MCP to book hotel
-    try:
-        print("\nBooking hotel via travel-mcp...")
-        hotel_result = client.invoke(
-            mcp="travel-mcp",
-            action="book_hotel",
-            intent_token=token,
-            params={
-                "location": "Paris",
-                "check_in": "2026-02-15",
-                "check_out": "2026-02-18",
-                "rooms": 1,
-            },
-        )
-
-        print(f"✅ Hotel booked!")
-        print(f"   Status: {hotel_result.status}")
-        print(f"   Execution Time: {hotel_result.execution_time:.2f}s")
-        print(f"   Result: {hotel_result.result}")
+    # The flight and hotel bookings are independent, so send them together:
+    # invoke_batch runs them concurrently over the client's shared connection
+    # pool and returns results (or exceptions) in request order.
+    print("Booking flight and hotel via travel-mcp...")
+    flight_result, hotel_result = client.invoke_batch(
+        [
+            MCPInvocation(
+                mcp="travel-mcp",
+                action="book_flight",
+                intent_token=token,
+                params={
+                    "origin": "SFO",
+                    "destination": "CDG",
+                    "date": "2026-02-15",
+                    "passengers": 1,
+                },
+            ),
+            MCPInvocation(
+                mcp="travel-mcp",
+                action="book_hotel",
+                intent_token=token,
+                params={
+                    "location": "Paris",
+                    "check_in": "2026-02-15",
+                    "check_out": "2026-02-18",
+                    "rooms": 1,
+                },
+            ),
+        ]
+    )
 
-    except Exception as e:
-        print(f"❌ Hotel booking failed: {e}")
+    for label, result in (("Flight", flight_result), ("Hotel", hotel_result)):
+        if isinstance(result, InvalidTokenException):
+            print(f"❌ {label}: token validation failed: {result}")
+        elif isinstance(result, IntentMismatchException):
+            print(f"❌ {label}: action not in plan: {result}")
+        elif isinstance(result, Exception):
+            print(f"❌ {label} booking failed: {result}")
+        else:
+            print(f"✅ {label} booked!")
+            print(f"   Status: {result.status}")
+            print(f"   Execution Time: {result.execution_time:.2f}s")
+            print(f"   Result: {result.result}")
 
     print("\n✨ Complete! All actions executed successfully.")
     print("=" * 60)
@@ -119,4 +118,4 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
@@ -70,7 +70,7 @@ def main():
         print(f"      Trust Delta: {events_delegation.trust_delta}")
 
     except Exception as e:
-        logger.error(f"Events delegation failed: {e}")
+        logger.error("Events delegation failed: %s", e)
 
     # Subtask 2: Delegate to travel agent
     print("\n2️⃣ Delegating transportation to travel agent...")
@@ -94,7 +94,7 @@ def main():
         print(f"      New Token: {travel_delegation.new_token.token_id}")
 
     except Exception as e:
-        logger.error(f"Travel delegation failed: {e}")
+        logger.error("Travel delegation failed: %s", e)
 
     # Subtask 3: Delegate to comms agent
     print("\n3️⃣ Delegating invitations to comms agent...")
@@ -119,7 +119,7 @@ def main():
         print(f"      New Token: {comms_delegation.new_token.token_id}")
 
     except Exception as e:
-        logger.error(f"Comms delegation failed: {e}")
+        logger.error("Comms delegation failed: %s", e)
 
     print("\n" + "=" * 60)
     print("✨ All subtasks delegated successfully!")
@@ -35,11 +35,10 @@ def handle_invalid_token():
         plan = client.capture_plan("gpt-4", "Test action")
         token = client.get_intent_token(plan)
 
-        # Simulate invalid token by tampering
-        from copy import deepcopy
-
-        invalid_token = deepcopy(token)
-        invalid_token.raw_token["signature"] = "invalid_signature"
+        # Simulate invalid token by tampering (shallow copy; the original
+        # token's raw_token is left untouched)
+        bad_raw = {**token.raw_token, "signature": "invalid_signature"}
+        invalid_token = token.model_copy(update={"raw_token": bad_raw})
 
         # Try to invoke with invalid token
         client.invoke("test-mcp", "test_action", invalid_token)
@@ -213,7 +212,7 @@ def main():
         try:
             handler()
         except Exception as e:
-            logger.error(f"Unexpected error in {name}: {e}", exc_info=True)
+            logger.error("Unexpected error in %s: %s", name, e, exc_info=True)
 
     print("\n" + "=" * 60)
     print("✨ Error handling examples complete!")
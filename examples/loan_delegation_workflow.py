@@ -21,11 +21,15 @@ passing and public key-based delegation.
 import asyncio
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import httpx
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 
-from armoriq_sdk import ArmorIQClient
+from armoriq_sdk import AsyncArmorIQClient
 from armoriq_sdk.models import PlanCapture, IntentToken
 from armoriq_sdk.exceptions import MCPInvocationException, DelegationException
 
@@ -37,22 +41,72 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_approval_keypair(agent_id: str) -> Tuple[ed25519.Ed25519PrivateKey, str]:
+    """Ed25519 keypair for an approval agent, as (private key, raw public key hex).
+    Call ``_get_approval_keypair.cache_clear()`` to rotate."""
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    public_hex = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    ).hex()
+    return private_key, public_hex
+
+
+def new_shared_transport() -> httpx.AsyncHTTPTransport:
+    """
+    One connection pool for every agent in this process.
+
+    Each agent keeps its own client (identity, headers), but passing the
+    same transport means the approval agent reuses the user agent's
+    keep-alive connections to the proxy instead of opening its own.
+    """
+    return httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=30.0,
+        ),
+        retries=1,
+    )
+
+
 class LoanUserAgent:
     """
     User agent that initiates loan requests.
     Similar to loan-agent-backend requester flow.
     """
+
+    APPROVAL_THRESHOLD = 50000
+
+    # Plan step skeletons; request_loan fills in "params" per request.
+    _ELIGIBILITY_STEP = {"step": 1, "mcp": "loan-mcp", "action": "check_eligibility"}
+    _APPROVE_STEP = {"step": 2, "mcp": "loan-mcp", "action": "approve_loan"}
+    _PROCESS_STEP = {"step": 2, "mcp": "loan-mcp", "action": "process_loan"}
     
-    def __init__(self):
-        self.client = ArmorIQClient(
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.user_email = "john.doe@example.com"
+        self.client = AsyncArmorIQClient(
             iap_endpoint=os.getenv("IAP_ENDPOINT", "http://localhost:3001"),
             proxy_endpoints={
                 "loan-mcp": os.getenv("LOAN_MCP_PROXY", "http://localhost:3002/loan-mcp"),
             },
             user_id="user-12345",
             agent_id="loan-user-agent",
+            user_email=self.user_email,
+            async_transport=transport,
         )
-        self.user_email = "john.doe@example.com"
+        # One approval-agent client for every delegation this agent makes;
+        # each LoanApprovalAgent only carries its own delegated token.
+        self.approval_client = LoanApprovalAgent.new_client(transport)
+        self._warmup: Optional["asyncio.Task[None]"] = None
+    
+    async def aclose(self) -> None:
+        """Close this agent's clients (the shared transport stays open)."""
+        if self._warmup is not None:
+            await self._warmup
+        await self.approval_client.aclose()
+        await self.client.aclose()
     
     async def request_loan(
         self,
@@ -69,87 +123,65 @@ class LoanUserAgent:
             loan_purpose: Purpose of loan
         """
         logger.info(
-            f"Starting loan request: customer={customer_id}, "
-            f"amount=${loan_amount:,.2f}, purpose={loan_purpose}"
+            "Starting loan request: customer=%s, amount=$%.2f, purpose=%s",
+            customer_id, loan_amount, loan_purpose,
         )
         
-        # Step 1: Capture the plan
+        # Step 1: Capture the plan. Loans above the threshold need the
+        # approval agent; smaller ones are processed directly.
+        needs_approval = loan_amount > self.APPROVAL_THRESHOLD
+        # Shared by both invoke() calls; the client adds user_email.
+        base_params = {"customer_id": customer_id, "loan_amount": loan_amount}
+        params = {**base_params, "user_email": self.user_email}
         plan_steps = [
-            {
-                "step": 1,
-                "mcp": "loan-mcp",
-                "action": "check_eligibility",
-                "params": {
-                    "customer_id": customer_id,
-                    "loan_amount": loan_amount,
-                    "user_email": self.user_email,
-                },
-            },
+            {**self._ELIGIBILITY_STEP, "params": params},
+            (
+                {**self._APPROVE_STEP, "params": {**params, "requires_delegation": True}}
+                if needs_approval
+                else {**self._PROCESS_STEP, "params": params}
+            ),
         ]
         
-        # Add approval step if amount > $50,000
-        if loan_amount > 50000:
-            plan_steps.append({
-                "step": 2,
-                "mcp": "loan-mcp",
-                "action": "approve_loan",
-                "params": {
-                    "customer_id": customer_id,
-                    "loan_amount": loan_amount,
-                    "user_email": self.user_email,
-                    "requires_delegation": True,
-                },
-            })
-        else:
-            plan_steps.append({
-                "step": 2,
-                "mcp": "loan-mcp",
-                "action": "process_loan",
-                "params": {
-                    "customer_id": customer_id,
-                    "loan_amount": loan_amount,
-                    "user_email": self.user_email,
-                },
-            })
-        
         plan = PlanCapture(
             description=f"Loan request for ${loan_amount:,.2f} - {loan_purpose}",
             steps=plan_steps,
             user_context={
                 "customer_id": customer_id,
                 "loan_purpose": loan_purpose,
-                "requested_at": datetime.utcnow().isoformat(),
+                "requested_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             },
         )
         
-        # Step 2: Get intent token from IAP
+        # Step 2: Get intent token from IAP. On the first request, open the
+        # proxy connections in the background so their handshakes overlap
+        # the token round trip instead of delaying the first invoke.
+        if self._warmup is None:
+            self._warmup = asyncio.create_task(self.client.warmup())
         logger.info("Getting intent token from IAP...")
-        token = self.client.get_intent_token(plan)
-        logger.info(
-            f"Token received: token_id={token.token_id}, "
-            f"expires_at={datetime.fromtimestamp(token.expires_at).isoformat()}"
-        )
+        token = await self.client.get_intent_token(plan)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Token received: token_id=%s, expires_at=%s",
+                token.token_id,
+                datetime.fromtimestamp(token.expires_at).isoformat(),
+            )
         
         # Log IAM context from token
         if token.policy_validation:
             allowed_tools = token.policy_validation.get("allowed_tools", [])
-            logger.info(f"Allowed tools in policy: {allowed_tools}")
+            logger.info("Allowed tools in policy: %s", allowed_tools)
         
         # Step 3: Check eligibility
         logger.info("Checking loan eligibility...")
         try:
-            eligibility_result = self.client.invoke(
+            eligibility_result = await self.client.invoke(
                 mcp="loan-mcp",
                 action="check_eligibility",
                 intent_token=token,
-                params={
-                    "customer_id": customer_id,
-                    "loan_amount": loan_amount,
-                },
-                user_email=self.user_email,
+                params=base_params,
             )
             
-            logger.info(f"Eligibility check result: {eligibility_result.result}")
+            logger.info("Eligibility check result: %s", eligibility_result.result)
             
             if not eligibility_result.result.get("eligible"):
                 logger.warning("Customer not eligible for loan")
@@ -159,11 +191,11 @@ class LoanUserAgent:
                 }
         
         except MCPInvocationException as e:
-            logger.error(f"Eligibility check failed: {e}")
+            logger.error("Eligibility check failed: %s", e)
             return {"status": "error", "reason": str(e)}
         
         # Step 4: Handle approval or processing
-        if loan_amount > 50000:
+        if needs_approval:
             # Requires delegation to approval agent
             logger.info("Loan amount > $50k, delegating to approval agent...")
             return await self._delegate_for_approval(
@@ -173,15 +205,11 @@ class LoanUserAgent:
             # Process directly
             logger.info("Processing loan directly...")
             try:
-                process_result = self.client.invoke(
+                process_result = await self.client.invoke(
                     mcp="loan-mcp",
                     action="process_loan",
                     intent_token=token,
-                    params={
-                        "customer_id": customer_id,
-                        "loan_amount": loan_amount,
-                    },
-                    user_email=self.user_email,
+                    params=base_params,
                 )
                 
                 logger.info("Loan processed successfully")
@@ -192,7 +220,7 @@ class LoanUserAgent:
                 }
             
             except MCPInvocationException as e:
-                logger.error(f"Loan processing failed: {e}")
+                logger.error("Loan processing failed: %s", e)
                 return {"status": "error", "reason": str(e)}
     
     async def _delegate_for_approval(
@@ -204,23 +232,17 @@ class LoanUserAgent:
         """
         Delegate to approval agent using public key-based delegation.
         """
-        # Generate approval agent's keypair
-        # In production, approval agent would have pre-registered public key
-        approval_private_key = ed25519.Ed25519PrivateKey.generate()
-        approval_public_key = approval_private_key.public_key()
-        
-        # Serialize public key to hex
-        pub_key_bytes = approval_public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
+        # In production the approval agent would have a pre-registered key;
+        # here one keypair per agent identity is generated once and reused.
+        approval_private_key, approval_public_key_hex = _get_approval_keypair(
+            "loan-approval-agent"
         )
-        approval_public_key_hex = pub_key_bytes.hex()
         
-        logger.info(f"Approval agent public key: {approval_public_key_hex[:32]}...")
+        logger.info("Approval agent public key: %.32s...", approval_public_key_hex)
         
         try:
             # Create delegation
-            delegation_result = self.client.delegate(
+            delegation_result = await self.client.delegate(
                 intent_token=token,
                 delegate_public_key=approval_public_key_hex,
                 validity_seconds=1800,  # 30 minutes
@@ -229,24 +251,21 @@ class LoanUserAgent:
             )
             
             logger.info(
-                f"Delegation created: delegation_id={delegation_result.delegation_id}"
+                "Delegation created: delegation_id=%s", delegation_result.delegation_id
             )
             
             # Create approval agent with delegated token
             approval_agent = LoanApprovalAgent(
                 delegated_token=delegation_result.delegated_token,
                 private_key=approval_private_key,
+                client=self.approval_client,
             )
             
             # Approval agent processes the approval
-            approval_result = await approval_agent.approve_loan(
-                customer_id, loan_amount
-            )
-            
-            return approval_result
+            return await approval_agent.approve_loan(customer_id, loan_amount)
         
         except DelegationException as e:
-            logger.error(f"Delegation failed: {e}")
+            logger.error("Delegation failed: %s", e)
             return {"status": "error", "reason": f"Delegation failed: {str(e)}"}
 
 
@@ -256,18 +275,37 @@ class LoanApprovalAgent:
     Similar to loan-agent-backend approval flow.
     """
     
-    def __init__(self, delegated_token: IntentToken, private_key):
-        self.client = ArmorIQClient(
+    def __init__(
+        self,
+        delegated_token: IntentToken,
+        private_key,
+        client: AsyncArmorIQClient,
+    ):
+        self.client = client
+        self.delegated_token = delegated_token
+        # None when the token carries no policy validation (nothing to check).
+        policy_validation = delegated_token.policy_validation
+        self._allowed_tools = (
+            frozenset(policy_validation.get("allowed_tools", ()))
+            if policy_validation
+            else None
+        )
+        self.private_key = private_key
+        self.approver_email = "loan.approver@example.com"
+    
+    @staticmethod
+    def new_client(transport: httpx.AsyncBaseTransport) -> AsyncArmorIQClient:
+        """Client for the approval agent's identity; safe to share across
+        LoanApprovalAgent instances, since the token is passed per call."""
+        return AsyncArmorIQClient(
             iap_endpoint=os.getenv("IAP_ENDPOINT", "http://localhost:3001"),
             proxy_endpoints={
                 "loan-mcp": os.getenv("LOAN_MCP_PROXY", "http://localhost:3002/loan-mcp"),
             },
             user_id="approval-system",
             agent_id="loan-approval-agent",
+            async_transport=transport,
         )
-        self.delegated_token = delegated_token
-        self.private_key = private_key
-        self.approver_email = "loan.approver@example.com"
     
     async def approve_loan(self, customer_id: str, loan_amount: float):
         """
@@ -278,14 +316,13 @@ class LoanApprovalAgent:
             loan_amount: Loan amount to approve
         """
         logger.info(
-            f"Approval agent processing: customer={customer_id}, "
-            f"amount=${loan_amount:,.2f}"
+            "Approval agent processing: customer=%s, amount=$%.2f",
+            customer_id, loan_amount,
         )
         
         # Verify delegated token has approval permission
-        if self.delegated_token.policy_validation:
-            allowed_tools = self.delegated_token.policy_validation.get("allowed_tools", [])
-            if "approve_loan" not in allowed_tools:
+        if self._allowed_tools is not None:
+            if "approve_loan" not in self._allowed_tools:
                 logger.error("Delegated token does not have approve_loan permission")
                 return {
                     "status": "denied",
@@ -294,7 +331,7 @@ class LoanApprovalAgent:
         
         # Invoke approval action with delegated token
         try:
-            approval_result = self.client.invoke(
+            approval_result = await self.client.invoke(
                 mcp="loan-mcp",
                 action="approve_loan",
                 intent_token=self.delegated_token,
@@ -315,7 +352,7 @@ class LoanApprovalAgent:
             }
         
         except MCPInvocationException as e:
-            logger.error(f"Approval failed: {e}")
+            logger.error("Approval failed: %s", e)
             return {
                 "status": "denied",
                 "reason": str(e),
@@ -331,25 +368,30 @@ async def main():
     print("=" * 80)
     print()
     
-    # Create user agent
-    user_agent = LoanUserAgent()
-    
-    # Example 1: Small loan (no delegation needed)
+    async with new_shared_transport() as transport:
+        user_agent = LoanUserAgent(transport)
+        try:
+            # The two requests are independent, so run them concurrently:
+            # Example 1 is a small loan (no delegation needed), Example 2 a
+            # large one that is delegated to the approval agent.
+            result1, result2 = await asyncio.gather(
+                user_agent.request_loan(
+                    customer_id="CUST-001",
+                    loan_amount=25000.00,
+                    loan_purpose="Home renovation",
+                ),
+                user_agent.request_loan(
+                    customer_id="CUST-002",
+                    loan_amount=150000.00,
+                    loan_purpose="Business expansion",
+                ),
+            )
+        finally:
+            await user_agent.aclose()
+
     print("\n--- Example 1: Small Loan Request ($25,000) ---")
-    result1 = await user_agent.request_loan(
-        customer_id="CUST-001",
-        loan_amount=25000.00,
-        loan_purpose="Home renovation",
-    )
     print(f"Result: {result1}")
-    
-    # Example 2: Large loan (requires delegation)
     print("\n--- Example 2: Large Loan Request ($150,000) ---")
-    result2 = await user_agent.request_loan(
-        customer_id="CUST-002",
-        loan_amount=150000.00,
-        loan_purpose="Business expansion",
-    )
     print(f"Result: {result2}")
     
     print("\n" + "=" * 80)
@@ -95,7 +95,7 @@ def main():
             print("\n2️⃣ Insufficient balance. Skipping flight booking.")
 
     except Exception as e:
-        logger.error(f"Workflow failed: {e}")
+        logger.error("Workflow failed: %s", e)
 
     print("\n" + "=" * 60)
     print("✨ Multi-MCP workflow complete!")
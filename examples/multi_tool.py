@@ -2,77 +2,92 @@
 ArmorIQ Customer SDK - Multi-Tool Example
 ========================================
 
-Shows how to execute multiple tools in sequence using the same token.
+Shows how to execute multiple tools concurrently using the same token.
 
 This example:
-1. Gets weather for multiple cities
+1. Gets weather for multiple cities in parallel
 2. Demonstrates proper error handling
 3. Shows how to reuse tokens
 """
 
-from armoriq import Client, Action
-from armoriq.exceptions import ToolInvocationError, NetworkError
+import asyncio
 
-def main():
+from armoriq_sdk import (
+    AsyncArmorIQClient,
+    InvalidTokenException,
+    MCPInvocationException,
+)
+
+
+async def main():
     print("🌍 Multi-City Weather Comparison\n")
-    
+
     # Initialize client
-    client = Client(
+    client = AsyncArmorIQClient(
         user_id="developer123",
-        api_key="demo-api-key",
+        api_key="ak_test_demo",
         iap_endpoint="http://localhost:8082",
-        proxy_endpoint="http://localhost:3001"
+        proxy_endpoint="http://localhost:3001",
     )
-    
+
     # Cities to check
     cities = ["Boston", "New York", "Los Angeles", "Chicago"]
-    
-    # Create plan for all cities
-    print("Creating plan for multiple cities...")
-    plan = client.create_plan(
-        goal=f"Get weather for {len(cities)} cities",
-        actions=[
-            Action(
-                tool="get_weather",
-                params={"city": city},
-                description=f"Get weather for {city}"
-            )
-            for city in cities
-        ]
-    )
-    
-    # Get token once (reusable for all actions in the plan)
-    print("Getting access token...\n")
-    token = client.get_token(plan)
-    
-    # Execute each action
-    results = {}
-    for city in cities:
-        try:
-            print(f"📍 Checking weather in {city}...")
-            
-            result = client.call(
-                mcp="weather-mcp",
-                tool="get_weather",
-                params={"city": city},
-                token=token
-            )
-            
-            if result.success:
-                results[city] = result.data
-                print(f"   ✅ {result.data}")
+
+    try:
+        # Create plan for all cities
+        print("Creating plan for multiple cities...")
+        plan = client.capture_plan(
+            llm="gpt-4",
+            prompt=f"Get weather for {len(cities)} cities",
+            plan={
+                "goal": f"Get weather for {len(cities)} cities",
+                "steps": [
+                    {
+                        "action": "get_weather",
+                        "mcp": "weather-mcp",
+                        "params": {"city": city},
+                        "description": f"Get weather for {city}",
+                    }
+                    for city in cities
+                ],
+            },
+        )
+
+        # Get token once (reusable for all actions in the plan)
+        print("Getting access token...\n")
+        token = await client.get_intent_token(plan)
+
+        # The calls don't depend on each other, so issue them all at once:
+        # total latency is about one round trip instead of one per city.
+        print(f"📍 Checking weather in {', '.join(cities)}...")
+        outcomes = await asyncio.gather(
+            *(
+                client.invoke("weather-mcp", "get_weather", token, params={"city": city})
+                for city in cities
+            ),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for city, outcome in zip(cities, outcomes):
+            if isinstance(outcome, MCPInvocationException):
+                print(f"   ❌ {city}: tool error: {outcome}")
+            elif isinstance(outcome, InvalidTokenException):
+                print(f"   ❌ {city}: token rejected: {outcome}")
+            elif isinstance(outcome, Exception):
+                print(f"   ❌ {city}: {outcome}")
+            elif outcome.status == "success":
+                results[city] = outcome.result
+                print(f"   ✅ {city}: {outcome.result}")
             else:
-                print(f"   ❌ Failed: {result.error}")
-                
-        except ToolInvocationError as e:
-            print(f"   ❌ Tool error: {e.message}")
-        except NetworkError as e:
-            print(f"   ❌ Network error: {e.message}")
-    
+                print(f"   ❌ {city}: failed: {outcome.result}")
+    finally:
+        await client.aclose()
+
     # Summary
     print(f"\n📊 Summary:")
     print(f"   Successfully fetched weather for {len(results)}/{len(cities)} cities")
-    
+
     if results:
         print(f"\n🌡️  Results:")
         for city, data in results.items():
@@ -80,4 +95,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,53 +1,34 @@
 """
 ArmorIQ SDK - Build Secure AI Agents
+
+Package metadata lives in pyproject.toml. This shim only contributes the
+optional compiled SSE parser, which static metadata cannot express.
 """
-from setuptools import setup, find_packages
-from pathlib import Path
+import os
+
+from setuptools import Extension, setup
+
+
+def _ext_modules():
+    """Optional compiled SSE parser; the pure-Python one in client.py is the fallback.
+
+    Opt-in via ``ARMORIQ_BUILD_EXT=1`` so default builds stay pure and produce a
+    ``py3-none-any`` wheel. Cython must then be importable by the build (e.g.
+    ``pip install Cython`` and ``--no-build-isolation``); ``optional=True`` lets
+    the build go on without a C compiler.
+    """
+    if os.environ.get("ARMORIQ_BUILD_EXT", "").lower() not in ("1", "true", "yes"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError as e:
+        raise RuntimeError(
+            "ARMORIQ_BUILD_EXT is set but Cython is not installed in the build environment"
+        ) from e
+    return cythonize(
+        [Extension("armoriq_sdk._sse_parser", ["armoriq_sdk/_sse_parser.pyx"], optional=True)],
+        quiet=True,
+    )
 
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
-setup(
-    name="armoriq-sdk",
-    version="0.3.9",  # Updated to match pyproject.toml and __init__.py
-    author="ArmorIQ Team",
-    author_email="license@armoriq.io",
-    description="ArmorIQ SDK - Build secure AI agents with cryptographic intent verification.",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://armoriq.ai",
-    project_urls={
-        "Documentation": "https://docs.armoriq.ai",
-        "Source Code": "https://github.com/armoriq/armoriq-sdk-python",
-    },
-    packages=find_packages(exclude=["tests*", "examples*"]),
-    python_requires=">=3.9",
-    install_requires=[
-        "httpx>=0.24.0",
-        "pydantic>=2.0.0",
-        "cryptography>=41.0.0",
-        "PyYAML>=6.0",
-    ],
-    extras_require={
-        "dev": ["pytest>=7.0.0", "pytest-asyncio>=0.21.0", "black", "mypy"],
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Security",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-    ],
-    keywords="armoriq sdk ai agents security verification",
-    entry_points={
-        "console_scripts": [
-            "armoriq=armoriq_sdk.cli:main",
-            "armoriq-cli=armoriq_sdk.cli:main",
-        ]
-    },
-)
+setup(ext_modules=_ext_modules())
@@ -4,8 +4,21 @@ Pytest configuration and fixtures.
 
 import pytest
 
+from armoriq_sdk.models import PlanCapture
+
 
 def pytest_configure(config):
     """Configure pytest."""
     config.addinivalue_line("markers", "integration: mark test as integration test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
+
+
+@pytest.fixture
+def sample_plan():
+    """A one-step plan, shared by the sync and async client tests."""
+    return PlanCapture(
+        plan={"goal": "test", "steps": [{"action": "do_thing", "mcp": "test-mcp"}]},
+        llm="gpt-4",
+        prompt="test",
+        metadata={},
+    )
@@ -0,0 +1,233 @@
+"""
+Unit tests for AsyncArmorIQClient.
+
+The async transport is mocked via ``client.http_client`` (an AsyncMock);
+request building and response parsing are shared with ArmorIQClient.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from armoriq_sdk import (
+    AsyncArmorIQClient,
+    ConfigurationException,
+    InvalidTokenException,
+    MCPInvocationException,
+    PolicyBlockedException,
+)
+from armoriq_sdk.models import MCPInvocation
+
+from .test_client import _make_token, _response
+
+
+@pytest.fixture
+def aclient():
+    c = AsyncArmorIQClient(
+        api_key="ak_test_fake123",
+        user_id="test_user",
+        agent_id="test_agent",
+        use_production=False,
+    )
+    c.http_client = AsyncMock()
+    yield c
+    c.sync.close()
+
+
+@pytest.mark.asyncio
+async def test_get_intent_token(aclient, sample_plan):
+    aclient.http_client.post.return_value = _response(
+        200,
+        {
+            "success": True,
+            "intent_reference": "ref_1",
+            "plan_hash": "hash_1",
+            "token": {"signature": "sig"},
+            "step_proofs": [[]],
+        },
+    )
+    token = await aclient.get_intent_token(sample_plan)
+    assert token.token_id == "ref_1"
+    headers = aclient.http_client.post.call_args.kwargs["headers"]
+    assert headers["X-API-Key"] == "ak_test_fake123"
+    assert "Idempotency-Key" in headers
+
+
+@pytest.mark.asyncio
+async def test_get_intent_token_refreshes_ahead_in_background(aclient, sample_plan):
+    now = time.time()
+    aclient.http_client.post.side_effect = [
+        _response(200, {"success": True, "intent_reference": "old",
+                        "token": {"expires_at": now + 33}}),
+        _response(200, {"success": True, "intent_reference": "new",
+                        "token": {"expires_at": now + 3600}}),
+    ]
+    assert (await aclient.get_intent_token(sample_plan)).token_id == "old"
+    # Inside the refresh-ahead window: served, replacement minted as a task.
+    assert (await aclient.get_intent_token(sample_plan)).token_id == "old"
+    await asyncio.gather(*aclient._refresh_tasks)
+    assert (await aclient.get_intent_token(sample_plan)).token_id == "new"
+    assert aclient.http_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_pending_refreshes(aclient, sample_plan):
+    now = time.time()
+    started = asyncio.Event()
+
+    async def post(*args, **kwargs):
+        if aclient.http_client.post.call_count == 1:
+            return _response(200, {"success": True, "intent_reference": "old",
+                                   "token": {"expires_at": now + 33}})
+        started.set()
+        await asyncio.sleep(3600)
+
+    aclient.http_client.post.side_effect = post
+    await aclient.get_intent_token(sample_plan)
+    await aclient.get_intent_token(sample_plan)
+    (task,) = aclient._refresh_tasks
+    await started.wait()
+    await aclient.aclose()
+    assert task.cancelled()
+    assert not aclient.sync._refreshing
+
+
+@pytest.mark.asyncio
+async def test_get_intent_token_policy_blocked(aclient, sample_plan):
+    aclient.http_client.post.return_value = _response(403, {"message": "nope"})
+    with pytest.raises(PolicyBlockedException):
+        await aclient.get_intent_token(sample_plan)
+
+
+@pytest.mark.asyncio
+async def test_get_intent_tokens_batch_fallback(aclient, sample_plan):
+    other = sample_plan.model_copy(update={"plan": {"goal": "other", "steps": []}})
+    aclient.http_client.post.side_effect = [
+        _response(404),
+        _response(200, {"success": True, "intent_reference": "a"}),
+        _response(200, {"success": True, "intent_reference": "b"}),
+    ]
+    tokens = await aclient.get_intent_tokens_batch([sample_plan, other])
+    assert [t.token_id for t in tokens] == ["a", "b"]
+    assert aclient.sync._supports_batch is False
+
+
+@pytest.mark.asyncio
+async def test_invoke(aclient):
+    aclient.http_client.post.return_value = _response(200, {"result": {"ok": True}})
+    result = await aclient.invoke("test-mcp", "do_thing", _make_token())
+    assert result.result == {"ok": True}
+    url = aclient.http_client.post.call_args.args[0]
+    assert url.endswith("/invoke")
+
+
+@pytest.mark.asyncio
+async def test_invoke_http_error(aclient):
+    aclient.http_client.post.return_value = _response(401, {"message": "bad"})
+    with pytest.raises(InvalidTokenException):
+        await aclient.invoke("test-mcp", "do_thing", _make_token())
+
+
+@pytest.mark.asyncio
+async def test_invoke_transport_error_wrapped(aclient):
+    aclient.http_client.post.side_effect = RuntimeError("socket closed")
+    with pytest.raises(MCPInvocationException, match="socket closed"):
+        await aclient.invoke("test-mcp", "do_thing", _make_token())
+
+
+@pytest.mark.asyncio
+async def test_delegate_reuses_cached_grant(aclient):
+    token = _make_token()
+    aclient.http_client.post.return_value = _response(
+        200, {"delegation": {"token_id": "deleg_tok", "expires_at": time.time() + 1800}}
+    )
+    first = await aclient.delegate(token, "abcd", allowed_actions=["b", "a"])
+    again = await aclient.delegate(token, "abcd", allowed_actions=["a", "b"])
+    assert again is first
+    assert first.delegated_token.token_id == "deleg_tok"
+    assert aclient.http_client.post.call_count == 1
+    assert aclient.http_client.post.call_args.args[0] == aclient.sync._delegate_url
+
+
+@pytest.mark.asyncio
+async def test_delegate_with_subtask_skips_cache(aclient):
+    token = _make_token()
+    aclient.http_client.post.return_value = _response(
+        200, {"delegation": {"token_id": "t", "expires_at": time.time() + 1800}}
+    )
+    await aclient.delegate(token, "abcd", subtask={"x": 1})
+    await aclient.delegate(token, "abcd", subtask={"x": 1})
+    assert aclient.http_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_near_expiry_delegation_is_not_reused(aclient):
+    token = _make_token()
+    aclient.http_client.post.return_value = _response(
+        200, {"delegation": {"token_id": "t", "expires_at": time.time() + 30}}
+    )
+    await aclient.delegate(token, "abcd")
+    await aclient.delegate(token, "abcd")
+    assert aclient.http_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invoke_batch_preserves_order_and_returns_errors(aclient):
+    token = _make_token()
+    aclient.http_client.post.side_effect = [
+        _response(200, {"result": {"n": 1}}),
+        _response(401, {"message": "bad"}),
+        _response(200, {"result": {"n": 3}}),
+    ]
+    specs = [
+        MCPInvocation(mcp="test-mcp", action="do_thing", intent_token=token, params={"i": i})
+        for i in range(3)
+    ]
+    results = await aclient.invoke_batch(specs, max_concurrent=1)
+    assert results[0].result["n"] == 1
+    assert isinstance(results[1], InvalidTokenException)
+    assert results[2].result["n"] == 3
+
+
+@pytest.mark.asyncio
+async def test_invoke_batch_fail_fast_raises(aclient):
+    token = _make_token()
+    aclient.http_client.post.return_value = _response(401, {"message": "bad"})
+    specs = [MCPInvocation(mcp="test-mcp", action="do_thing", intent_token=token)] * 2
+    with pytest.raises(InvalidTokenException):
+        await aclient.invoke_batch(specs, fail_fast=True)
+
+
+@pytest.mark.asyncio
+async def test_warmup_heads_each_endpoint_concurrently(aclient):
+    aclient.sync.proxy_endpoints = {"a": "http://proxy-a.test"}
+    aclient.http_client.head.side_effect = [None, httpx.ConnectError("down"), None]
+    await aclient.warmup()
+    urls = sorted(c.args[0] for c in aclient.http_client.head.call_args_list)
+    assert urls == sorted(
+        [
+            f"{aclient.sync.backend_endpoint}/health",
+            f"{aclient.sync.default_proxy_endpoint}/health",
+            "http://proxy-a.test/health",
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_async_transport_outlives_client():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    a = AsyncArmorIQClient(api_key="ak_test_a", async_transport=transport)
+    b = AsyncArmorIQClient(api_key="ak_test_b", async_transport=transport)
+    await a.aclose()
+    response = await b.http_client.get("http://proxy.test/health")
+    assert response.status_code == 200
+    await b.aclose()
+
+
+def test_pool_settings_with_async_transport_are_rejected():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    with pytest.raises(ConfigurationException, match="configure them on the transport"):
+        AsyncArmorIQClient(api_key="ak_test_a", async_transport=transport, http2=False)
@@ -0,0 +1,77 @@
+"""
+Tests for the bounded LRU / intent-token caches.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from armoriq_sdk._cache import LRUCache, TokenCache
+from armoriq_sdk.models import IntentToken
+
+
+def _token(plan_hash: str = "h", ttl: float = 60.0) -> IntentToken:
+    now = datetime.now().timestamp()
+    return IntentToken(
+        token_id=f"tok_{plan_hash}",
+        plan_hash=plan_hash,
+        signature="s",
+        issued_at=now,
+        expires_at=now + ttl,
+        composite_identity="ci",
+        raw_token={},
+    )
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now the LRU entry
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert len(cache) == 2
+
+
+class TestTokenCache:
+    def test_expired_token_is_dropped_on_get(self):
+        cache = TokenCache()
+        cache.put("k", _token(ttl=-1))
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_periodic_sweep_removes_expired(self):
+        cache = TokenCache(sweep_every=3)
+        cache.put("old", _token("old", ttl=-1))
+        cache.put("a", _token("a"))
+        assert len(cache) == 2
+        cache.put("b", _token("b"))
+        assert "old" not in cache
+        assert len(cache) == 2
+
+    def test_concurrent_puts_are_all_counted(self):
+        cache = TokenCache(maxsize=8, sweep_every=7)
+        token = _token()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: cache.put(i % 16, token), range(2000)))
+        assert cache._puts == 2000
+        assert len(cache) == 8
+
+    def test_invalidate_by_plan_hash(self):
+        cache = TokenCache()
+        cache.put(("h1", 60), _token("h1"))
+        cache.put(("h1", 120), _token("h1"))
+        cache.put(("h2", 60), _token("h2"))
+        assert cache.invalidate("h1") == 2
+        assert cache.get(("h2", 60)) is not None
+        cache.invalidate_all()
+        assert len(cache) == 0
+
+    def test_discard_exact_token(self):
+        cache = TokenCache()
+        token = _token("h1")
+        cache.put("a", token)
+        cache.put("b", _token("h1"))
+        assert cache.discard(token) == 1
+        assert "a" not in cache and "b" in cache
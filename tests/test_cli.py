@@ -73,3 +73,34 @@ def test_register_dry_run_writes_state(tmp_path, monkeypatch):
     code = cli.main(["register", "--dry-run", "--config", str(config_path)])
     assert code == 0
     assert cli.STATE_FILE.exists()
+
+
+def test_discover_all_runs_concurrently_in_order(monkeypatch):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_discover(server, timeout=8.0):
+        barrier.wait()  # deadlocks (and times out) if probes run one by one
+        return MCPDiscoveryResult(reachable=True, tools=[server.id])
+
+    monkeypatch.setattr(cli, "discover_mcp_tools", fake_discover)
+    servers = [cli.MCPServerConfig(id=i, url=f"https://{i}.test") for i in ("a", "b")]
+    assert [r.tools for r in cli._discover_all(servers)] == [["a"], ["b"]]
+
+
+class _TTY:
+    def isatty(self):
+        return True
+
+
+def test_styles_are_plain_when_stdout_is_not_a_tty(capsys, monkeypatch):
+    from armoriq_sdk._term import GREEN, RESET
+
+    # capsys swaps in a non-TTY stdout.
+    assert f"{GREEN}ok{RESET}" == "ok"
+    cli._print(f"{GREEN}ok{RESET}")
+    assert "\033" not in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.stdout", _TTY())
+    assert f"{GREEN}ok{RESET}" == "\033[32mok\033[0m"
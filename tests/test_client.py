@@ -5,6 +5,8 @@ The client performs HTTP calls against the IAP / proxy / backend; all are
 mocked via ``client.http_client`` so no network hits are made.
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -22,10 +24,12 @@ from armoriq_sdk import (
     TokenExpiredException,
 )
 from armoriq_sdk._build_env import resolve as _resolve_endpoint
+from armoriq_sdk.client import _parse_sse_body
 from armoriq_sdk.models import (
     ApprovedDelegation,
     DelegationRequestParams,
     IntentToken,
+    MCPInvocation,
     MCPSemanticMetadata,
     PlanCapture,
 )
@@ -50,16 +54,6 @@ def client():
     return c
 
 
-@pytest.fixture
-def sample_plan():
-    return PlanCapture(
-        plan={"goal": "test", "steps": [{"action": "do_thing", "mcp": "test-mcp"}]},
-        llm="gpt-4",
-        prompt="test",
-        metadata={},
-    )
-
-
 from cryptography.hazmat.primitives import serialization as _ser
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey as _Ed
 from armoriq_sdk.crypto_verify import canonical_json as _cj
@@ -110,6 +104,7 @@ def _response(status: int = 200, json_data=None, content_type: str = "applicatio
     resp.status_code = status
     resp.headers = {"content-type": content_type}
     resp.json.return_value = json_data or {}
+    resp.content = json.dumps(json_data or {}).encode("utf-8")
     resp.text = ""
     return resp
 
@@ -181,6 +176,41 @@ class TestClientInitialization:
             assert c is client
         client.http_client.close.assert_called_once()
 
+    def test_shared_transport_outlives_client(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        a = ArmorIQClient(api_key="ak_test_a", transport=transport, _skip_api_key_validation=True)
+        b = ArmorIQClient(api_key="ak_test_b", transport=transport, _skip_api_key_validation=True)
+        a.close()
+        response = b.http_client.get("http://proxy.test/health")
+        assert response.status_code == 200
+        assert response.request.headers["Authorization"] == "Bearer ak_test_b"
+
+    def test_env_proxy_is_mounted(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://corp-proxy.test:3128")
+        c = ArmorIQClient(api_key="ak_test_a", _skip_api_key_validation=True)
+        patterns = [p.pattern for p, t in c.http_client._mounts.items() if t is not None]
+        assert "https://" in patterns
+        c.close()
+
+    def test_prefer_h2_false_pins_http11(self):
+        c = ArmorIQClient(api_key="ak_test_a", prefer_h2=False, _skip_api_key_validation=True)
+        assert c._http2 is False
+        c.close()
+
+    def test_warmup_heads_each_endpoint_once(self, client):
+        client.proxy_endpoints = {
+            "a": "http://proxy-a.test",
+            "b": client.default_proxy_endpoint,
+        }
+        client.http_client.head.side_effect = [None, httpx.ConnectError("down"), None]
+        client.warmup()
+        urls = [c.args[0] for c in client.http_client.head.call_args_list]
+        assert urls == [
+            f"{client.backend_endpoint}/health",
+            f"{client.default_proxy_endpoint}/health",
+            "http://proxy-a.test/health",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # capture_plan
@@ -234,7 +264,83 @@ class TestGetIntentToken:
         assert token.policy_snapshot == [{"policyName": "p1"}]
         assert token.total_steps == 1
 
-    def test_http_500_raises_invalid_token(self, client, sample_plan):
+    def test_reuses_cached_token_for_same_plan(self, client, sample_plan):
+        client.http_client.post.return_value = _response(
+            200,
+            {"success": True, "intent_reference": "tok_1", "plan_hash": "hash_1"},
+        )
+        first = client.get_intent_token(sample_plan)
+        assert client.get_intent_token(sample_plan) is first
+        assert client.http_client.post.call_count == 1
+
+        client.get_intent_token(sample_plan, policy={"deny": ["x"]})
+        assert client.http_client.post.call_count == 2
+
+        client.invalidate_token("hash_1")
+        client.get_intent_token(sample_plan)
+        assert client.http_client.post.call_count == 3
+
+    def test_cache_tokens_false_mints_every_call(self, client, sample_plan):
+        client.cache_tokens = False
+        client.http_client.post.return_value = _response(
+            200, {"success": True, "intent_reference": "tok_1", "plan_hash": "hash_1"}
+        )
+        client.get_intent_token(sample_plan)
+        client.get_intent_token(sample_plan)
+        assert client.http_client.post.call_count == 2
+
+    def test_refreshes_ahead_of_expiry(self, client, sample_plan):
+        now = datetime.now().timestamp()
+        client.http_client.post.side_effect = [
+            _response(200, {"success": True, "intent_reference": "old",
+                            "token": {"expires_at": now + 33}}),
+            _response(200, {"success": True, "intent_reference": "new",
+                            "token": {"expires_at": now + 3600}}),
+        ]
+        assert client.get_intent_token(sample_plan).token_id == "old"
+        # 60 s requested: serving floor is 30 s, refresh-ahead window 30-35 s.
+        # Inside it: still served, replacement minted in background.
+        assert client.get_intent_token(sample_plan).token_id == "old"
+        client._refresh_executor.shutdown(wait=True)
+        assert client.get_intent_token(sample_plan).token_id == "new"
+        assert client.http_client.post.call_count == 2
+
+    def test_nearly_expired_token_is_reminted_synchronously(self, client, sample_plan):
+        now = datetime.now().timestamp()
+        client.http_client.post.side_effect = [
+            _response(200, {"success": True, "intent_reference": "old",
+                            "token": {"expires_at": now + 0.3}}),
+            _response(200, {"success": True, "intent_reference": "new",
+                            "token": {"expires_at": now + 3600}}),
+        ]
+        assert client.get_intent_token(sample_plan).token_id == "old"
+        # Below MIN_TOKEN_LIFETIME: not served, and no background refresh.
+        assert client.get_intent_token(sample_plan).token_id == "new"
+        assert client._refresh_executor is None
+        assert client.http_client.post.call_count == 2
+
+    def test_cached_token_must_cover_half_the_requested_validity(self, client, sample_plan):
+        now = datetime.now().timestamp()
+        client.http_client.post.side_effect = [
+            _response(200, {"success": True, "intent_reference": "short",
+                            "token": {"expires_at": now + 600}}),
+            _response(200, {"success": True, "intent_reference": "full",
+                            "token": {"expires_at": now + 3600}}),
+        ]
+        assert client.get_intent_token(sample_plan, validity_seconds=3600).token_id == "short"
+        # 600 s left is under half of the 3600 s asked for: mint synchronously.
+        assert client.get_intent_token(sample_plan, validity_seconds=3600).token_id == "full"
+        assert client.get_intent_token(sample_plan, validity_seconds=3600).token_id == "full"
+        assert client.http_client.post.call_count == 2
+
+    def test_refresh_pool_is_shared_across_threads(self, client):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pools = set(pool.map(lambda _: id(client._refresh_pool()), range(32)))
+        assert len(pools) == 1
+        client.close()
+
+    def test_http_500_raises_invalid_token(self, client, sample_plan, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda *_a, **_kw: None)
         client.http_client.post.return_value = _response(
             500, {"message": "down"}
         )
@@ -267,6 +373,42 @@ class TestGetIntentToken:
         with pytest.raises(InvalidTokenException, match="Token issuance failed"):
             client.get_intent_token(sample_plan)
 
+    def test_batch_mints_misses_in_one_request(self, client, sample_plan):
+        other = sample_plan.model_copy(update={"plan": {"goal": "other", "steps": []}})
+        client.http_client.post.return_value = _response(
+            200, {"success": True, "intent_reference": "cached"}
+        )
+        cached = client.get_intent_token(sample_plan)
+        client.http_client.post.return_value = _response(
+            200, {"tokens": [{"success": True, "intent_reference": "batched"}]}
+        )
+        tokens = client.get_intent_tokens_batch([sample_plan, other])
+        assert tokens[0] is cached
+        assert tokens[1].token_id == "batched"
+        call = client.http_client.post.call_args
+        assert call.args[0].endswith("/iap/sdk/token/batch")
+        assert [p["plan"] for p in json.loads(call.kwargs["content"])["batch"]] == [other.plan]
+        assert client.get_intent_token(other) is tokens[1]
+
+    def test_batch_falls_back_to_per_plan_requests(self, client, sample_plan):
+        other = sample_plan.model_copy(update={"plan": {"goal": "other", "steps": []}})
+        client.http_client.post.side_effect = lambda url, **kw: (
+            _response(404)
+            if url.endswith("/batch")
+            else _response(
+                200,
+                {"success": True, "intent_reference": json.loads(kw["content"])["plan"]["goal"]},
+            )
+        )
+        tokens = client.get_intent_tokens_batch([sample_plan, other])
+        assert [t.token_id for t in tokens] == ["test", "other"]
+        assert client._supports_batch is False
+
+        client.invalidate_all_tokens()
+        client.http_client.post.reset_mock()
+        client.get_intent_tokens_batch([sample_plan])
+        assert not client.http_client.post.call_args.args[0].endswith("/batch")
+
 
 # ---------------------------------------------------------------------------
 # invoke
@@ -287,6 +429,79 @@ class TestInvoke:
         assert result.verified is True
         assert result.result == {"ok": True}
 
+    def test_body_splices_encoded_token_fragments(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        client.invoke("test-mcp", "do_thing", token, params={"k": "v"})
+        body = json.loads(client.http_client.post.call_args.kwargs["content"])
+        assert body["params"] == {"k": "v"}
+        assert body["plan"] == token.raw_token["plan"]
+        assert body["token"] == body["csrg_token"] == token.raw_token["token"]
+        assert body["intent_token"]["plan_hash"] == "hash_1"
+        assert "policy_validation" in body["intent_token"]
+
+    def test_body_reuses_encoded_token_fragments(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        client.invoke("test-mcp", "do_thing", token)
+        fragments = client._token_fragments(token)
+        client.invoke("test-mcp", "do_thing", token)
+        assert client._token_fragments(token) is fragments
+
+    def test_in_place_token_edits_reach_the_wire(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        client.invoke("test-mcp", "do_thing", token)
+
+        token.raw_token["plan"]["goal"] = "edited"
+        token.step_proofs[0] = [{"position": "right", "hash": "new"}]
+        client.invoke("test-mcp", "do_thing", token)
+        kwargs = client.http_client.post.call_args.kwargs
+        assert json.loads(kwargs["content"])["plan"]["goal"] == "edited"
+        assert json.loads(kwargs["headers"]["X-CSRG-Proof"]) == token.step_proofs[0]
+
+    def test_csrg_headers_are_encoded_once_per_action(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        with patch.object(
+            ArmorIQClient, "_step_wire", wraps=ArmorIQClient._step_wire
+        ) as step_wire:
+            client.invoke("test-mcp", "do_thing", token)
+            client.invoke("test-mcp", "do_thing", token)
+            assert step_wire.call_count == 1
+            token.step_proofs[0] = [{"position": "right", "hash": "new"}]
+            client.invoke("test-mcp", "do_thing", token)
+            assert step_wire.call_count == 2
+
+    def test_csrg_headers(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        client.invoke("test-mcp", "do_thing", token)
+        headers = client.http_client.post.call_args.kwargs["headers"]
+        assert json.loads(headers["X-CSRG-Proof"]) == token.step_proofs[0]
+        assert headers["X-CSRG-Path"] == "/steps/[0]/action"
+
+        client.invoke("test-mcp", "do_thing", token, merkle_proof=[{"hash": "x"}])
+        headers = client.http_client.post.call_args.kwargs["headers"]
+        assert json.loads(headers["X-CSRG-Proof"]) == [{"hash": "x"}]
+
+    def test_client_user_email_is_invoke_default(self, client):
+        client.user_email = "default@example.com"
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        client.invoke("test-mcp", "do_thing", _make_token())
+        body = json.loads(client.http_client.post.call_args.kwargs["content"])
+        assert body["user_email"] == "default@example.com"
+        client.invoke("test-mcp", "do_thing", _make_token(), user_email="x@example.com")
+        body = json.loads(client.http_client.post.call_args.kwargs["content"])
+        assert body["_iam_context"]["email"] == "x@example.com"
+
+    def test_invoke_url_resolution_is_memoised(self, client, monkeypatch):
+        monkeypatch.setenv("ENVMCP_PROXY_URL", "http://env.test")
+        assert client._invoke_url("envmcp") == "http://env.test/invoke"
+        monkeypatch.delenv("ENVMCP_PROXY_URL")
+        assert client._invoke_url("envmcp") == "http://env.test/invoke"
+        assert client._invoke_url("other") == f"{client.default_proxy_endpoint}/invoke"
+
     def test_expired_token(self, client):
         now = datetime.now().timestamp()
         expired = IntentToken(
@@ -315,6 +530,19 @@ class TestInvoke:
         with pytest.raises(InvalidTokenException):
             client.invoke("test-mcp", "do_thing", token)
 
+    def test_rejected_token_is_evicted_from_cache(self, client, sample_plan):
+        client.http_client.post.return_value = _response(
+            200, {"success": True, "intent_reference": "tok_1", "plan_hash": "h"}
+        )
+        token = client.get_intent_token(sample_plan)
+        client.http_client.post.return_value = _response(401, {"message": "revoked"})
+        with pytest.raises(InvalidTokenException):
+            client.invoke("test-mcp", "do_thing", token.model_copy(update={"step_proofs": [[]]}))
+        assert len(client._token_cache) == 1  # a different token object: kept
+        with pytest.raises(InvalidTokenException):
+            client.invoke("test-mcp", "do_thing", token, merkle_proof=[{"hash": "x"}])
+        assert len(client._token_cache) == 0
+
     def test_409_raises_intent_mismatch(self, client):
         token = _make_token()
         client.http_client.post.return_value = _response(
@@ -348,6 +576,37 @@ class TestInvoke:
         with pytest.raises(MCPInvocationException):
             client.invoke("test-mcp", "do_thing", token)
 
+    def test_error_body_is_decoded_once(self, client):
+        resp = _response(500, {"message": "boom"})
+        client.http_client.post.return_value = resp
+        with pytest.raises(MCPInvocationException, match="boom"):
+            client.invoke("test-mcp", "do_thing", _make_token())
+        resp.json.assert_not_called()
+
+    def test_non_json_error_body_is_truncated(self, client):
+        resp = _response(502)
+        resp.content = b"<html>" + b"x" * 10_000 + b"</html>"
+        client.http_client.post.return_value = resp
+        with pytest.raises(MCPInvocationException) as exc_info:
+            client.invoke("test-mcp", "do_thing", _make_token())
+        assert "<html>" in str(exc_info.value)
+        assert "</html>" not in str(exc_info.value)
+
+    def test_circuit_opens_after_consecutive_5xx(self, client):
+        token = _make_token()
+        client.http_client.post.return_value = _response(503, {"message": "down"})
+        for _ in range(5):
+            with pytest.raises(MCPInvocationException, match="MCP invocation failed"):
+                client.invoke("test-mcp", "do_thing", token)
+        with pytest.raises(MCPInvocationException, match="Circuit open"):
+            client.invoke("test-mcp", "do_thing", token)
+        assert client.http_client.post.call_count == 5
+
+        client._circuit.reset_after = 0.0  # half-open: one trial call goes through
+        client.http_client.post.return_value = _response(200, {"result": {}})
+        assert client.invoke("test-mcp", "do_thing", token).status == "success"
+        assert client._circuit.allow("test-mcp")
+
     def test_tool_error_in_result(self, client):
         token = _make_token()
         client.http_client.post.return_value = _response(
@@ -357,12 +616,85 @@ class TestInvoke:
         assert result.status == "error"
         assert result.metadata["hasToolError"] is True
 
+    def test_sse_response(self, client):
+        token = _make_token()
+        resp = _response(200, content_type="text/event-stream; charset=utf-8")
+        resp.content = (
+            b"event: message\n"
+            b"data: not-json\n"
+            b'data: {"result": {"ok": true}}\n\n'
+        )
+        client.http_client.post.return_value = resp
+        result = client.invoke("test-mcp", "do_thing", token)
+        assert result.result == {"ok": True}
+
+    def test_sse_response_without_data_raises(self, client):
+        token = _make_token()
+        resp = _response(200, content_type="text/event-stream")
+        resp.content = b"event: ping\n\n"
+        client.http_client.post.return_value = resp
+        with pytest.raises(MCPInvocationException, match="No data in SSE response"):
+            client.invoke("test-mcp", "do_thing", token)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"event: ping\n\n",
+            b'event: message\ndata: not-json\ndata: {"result": {"ok": true}}\n\n',
+            b'data: {"a": 1}',
+            b'data: {"a": 1}\r\ndata: {"b": 2}\r\n',
+            b"data: null\ndata: 0\n",
+            b'data:{"no": "space"}\n',
+        ],
+    )
+    def test_compiled_sse_parser_matches_python(self, content):
+        compiled = pytest.importorskip("armoriq_sdk._sse_parser")
+        assert compiled._parse_sse_body(content) == _parse_sse_body(content)
+
 
 # ---------------------------------------------------------------------------
 # delegate (legacy CSRG path)
 # ---------------------------------------------------------------------------
 
 
+class TestInvokeBatch:
+    @staticmethod
+    def _post(url, content=None, headers=None):
+        body = json.loads(content)
+        if body["params"].get("fail"):
+            return _response(500, {"message": "boom"})
+        return _response(200, {"result": {"i": body["params"]["i"]}})
+
+    def _specs(self, fail_at=None):
+        token = _make_token()
+        return [
+            MCPInvocation(
+                mcp="test-mcp",
+                action="do_thing",
+                intent_token=token,
+                params={"i": i, "fail": i == fail_at},
+            )
+            for i in range(4)
+        ]
+
+    def test_results_in_spec_order(self, client):
+        client.http_client.post.side_effect = self._post
+        results = client.invoke_batch(self._specs(), max_concurrent=3)
+        assert [r.result["i"] for r in results] == [0, 1, 2, 3]
+
+    def test_errors_are_returned_in_place(self, client):
+        client.http_client.post.side_effect = self._post
+        results = client.invoke_batch(self._specs(fail_at=2))
+        assert isinstance(results[2], MCPInvocationException)
+        assert results[3].result == {"i": 3}
+
+    def test_fail_fast_raises(self, client):
+        client.http_client.post.side_effect = self._post
+        with pytest.raises(MCPInvocationException):
+            client.invoke_batch(self._specs(fail_at=0), fail_fast=True)
+
+
 class TestDelegate:
     def test_success(self, client):
         token = _make_token()
@@ -388,6 +720,69 @@ class TestDelegate:
         assert result.delegated_token.token_id == "deleg_tok"
         assert result.delegate_public_key == "abcd"
 
+    def test_repeat_delegation_is_reused_until_rejected(self, client):
+        token = _make_token()
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200,
+            {"delegation": {"token_id": "deleg_tok", "expires_at": now + 1800}},
+        )
+        first = client.delegate(token, "abcd", allowed_actions=["b", "a"])
+        again = client.delegate(token, "abcd", allowed_actions=["a", "b"])
+        assert again is first
+        assert client.http_client.post.call_count == 1
+
+        client.delegate(token, "abcd", allowed_actions=["a"], subtask={"x": 1})
+        assert client.http_client.post.call_count == 2
+
+        with pytest.raises(InvalidTokenException):
+            client._raise_http_error(_response(401), "m", "a", first.delegated_token, "no")
+        client.delegate(token, "abcd", allowed_actions=["a", "b"])
+        assert client.http_client.post.call_count == 3
+
+    def test_tokens_sharing_token_id_get_separate_grants(self, client):
+        now = datetime.now().timestamp()
+        client.http_client.post.side_effect = [
+            _response(200, {"delegation": {"token_id": "grant_a", "expires_at": now + 1800}}),
+            _response(200, {"delegation": {"token_id": "grant_b", "expires_at": now + 1800}}),
+        ]
+        plan_a = _make_token()
+        plan_b = plan_a.model_copy(update={"plan_hash": "hash_2", "signature": "sig_2"})
+        a = client.delegate(plan_a, "abcd")
+        b = client.delegate(plan_b, "abcd")
+        assert (a.delegated_token.token_id, b.delegated_token.token_id) == ("grant_a", "grant_b")
+        assert client.http_client.post.call_count == 2
+
+    def test_placeholder_token_id_is_not_cached(self, client):
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200, {"delegation": {"token_id": "t", "expires_at": now + 1800}}
+        )
+        token = _make_token().model_copy(update={"token_id": "unknown"})
+        client.delegate(token, "abcd")
+        client.delegate(token, "abcd")
+        assert client.http_client.post.call_count == 2
+
+    def test_delegation_cache_key_includes_validity(self, client):
+        token = _make_token()
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200, {"delegation": {"token_id": "t", "expires_at": now + 1800}}
+        )
+        client.delegate(token, "abcd", validity_seconds=3600)
+        client.delegate(token, "abcd", validity_seconds=300)
+        assert client.http_client.post.call_count == 2
+
+    def test_near_expiry_delegation_is_not_reused(self, client):
+        token = _make_token()
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200, {"delegation": {"token_id": "t", "expires_at": now + 30}}
+        )
+        client.delegate(token, "abcd")
+        client.delegate(token, "abcd")
+        assert client.http_client.post.call_count == 2
+
     def test_missing_delegation_key(self, client):
         token = _make_token()
         client.http_client.post.return_value = _response(200, {"delegation_id": "d"})
@@ -403,6 +798,61 @@ class TestDelegate:
             client.delegate(token, delegate_public_key="abcd")
 
 
+class TestRevokeReanchor:
+    def _mint(self, client, sample_plan):
+        client.http_client.post.return_value = _response(
+            200,
+            {"success": True, "intent_reference": "tok_1", "plan_hash": "hash_1",
+             "token": {"signature": "sig_1"}},
+        )
+        return client.get_intent_token(sample_plan)
+
+    def test_revoke_drops_token_and_its_delegations(self, client, sample_plan):
+        token = self._mint(client, sample_plan)
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200, {"delegation": {"token_id": "child", "signature": "child_sig",
+                                 "expires_at": now + 1800}}
+        )
+        child = client.delegate(token, "abcd")
+
+        client.http_client.post.return_value = _response(200, {"revoked": True})
+        client.revoke(token, reason="compromised")
+
+        calls = client.http_client.post.call_count
+        client.http_client.post.return_value = _response(
+            200, {"success": True, "intent_reference": "tok_2", "plan_hash": "hash_1"}
+        )
+        assert client.get_intent_token(sample_plan) is not token
+        assert client.http_client.post.call_count == calls + 1
+        assert client._delegation_cache.discard_if(lambda d: d is child) == 0
+
+    def test_revoking_a_delegated_token_drops_its_grant(self, client):
+        now = datetime.now().timestamp()
+        client.http_client.post.return_value = _response(
+            200, {"delegation": {"token_id": "child", "signature": "child_sig",
+                                 "expires_at": now + 1800}}
+        )
+        grant = client.delegate(_make_token(), "abcd")
+        client.http_client.post.return_value = _response(200, {"revoked": True})
+        client.revoke(grant.delegated_token, reason="done")
+        assert len(client._delegation_cache) == 0
+
+    def test_failed_revoke_keeps_cache(self, client, sample_plan, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda *_a, **_kw: None)
+        token = self._mint(client, sample_plan)
+        client.http_client.post.return_value = _response(400, {"message": "bad"})
+        with pytest.raises(DelegationException):
+            client.revoke(token, reason="x")
+        assert client.get_intent_token(sample_plan) is token
+
+    def test_reanchor_invalidates_tokens_for_old_plan(self, client, sample_plan):
+        token = self._mint(client, sample_plan)
+        client.http_client.post.return_value = _response(200, {"ok": True})
+        client.reanchor(token, updated_plan={"goal": "new", "steps": []})
+        assert len(client._token_cache) == 0
+
+
 # ---------------------------------------------------------------------------
 # verify_token
 # ---------------------------------------------------------------------------
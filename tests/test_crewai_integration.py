@@ -437,7 +437,7 @@ class TestArmorIQCrewKickoff(unittest.TestCase):
 
 class TestArmorIQCrewKickoffAsync(unittest.TestCase):
     def _run(self, coro):
-        return asyncio.get_event_loop().run_until_complete(coro)
+        return asyncio.run(coro)
 
     def test_kickoff_async_awaits_inner_crew(self):
         tool = _make_armoriq_tool()
@@ -45,3 +45,14 @@ def test_verify_rejects_tampered_plan_hash():
 def test_verify_rejects_malformed_inputs():
     assert verify_ed25519("00", b"x", SIGNATURE) is False
     assert verify_ed25519(PUBLIC_KEY, b"x", "ab") is False
+
+
+def test_verify_result_is_memoised_on_exact_inputs():
+    verify_ed25519.cache_clear()
+    message = canonical_json(PAYLOAD)
+    assert verify_ed25519(PUBLIC_KEY, message, SIGNATURE) is True
+    assert verify_ed25519(PUBLIC_KEY, message, SIGNATURE) is True
+    assert verify_ed25519.cache_info().hits == 1
+    tampered = canonical_json({**PAYLOAD, "plan_hash": "deadbeef"})
+    assert verify_ed25519(PUBLIC_KEY, tampered, SIGNATURE) is False
+    assert verify_ed25519.cache_info().misses == 2
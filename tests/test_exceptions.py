@@ -4,6 +4,8 @@ Unit tests for ArmorIQ SDK exceptions.
 Mirrors parity with TypeScript SDK exception surface.
 """
 
+import pickle
+
 import pytest
 
 from armoriq_sdk.exceptions import (
@@ -25,25 +27,23 @@ class TestExceptionHierarchy:
         assert str(exc) == "test error"
         assert isinstance(exc, Exception)
 
-    def test_invalid_token_inherits_base(self):
-        assert isinstance(InvalidTokenException("e"), ArmorIQException)
-
-    def test_intent_mismatch_inherits_base(self):
-        assert isinstance(IntentMismatchException("e"), ArmorIQException)
-
-    def test_token_expired_inherits_invalid_token(self):
-        exc = TokenExpiredException("expired")
-        assert isinstance(exc, InvalidTokenException)
-        assert isinstance(exc, ArmorIQException)
-
-    def test_policy_blocked_inherits_base(self):
-        assert isinstance(PolicyBlockedException("blocked"), ArmorIQException)
-
-    def test_policy_hold_inherits_base(self):
-        assert isinstance(PolicyHoldException("hold"), ArmorIQException)
-
-    def test_configuration_inherits_base(self):
-        assert isinstance(ConfigurationException("bad"), ArmorIQException)
+    @pytest.mark.parametrize(
+        "exc_cls, bases",
+        [
+            (InvalidTokenException, (ArmorIQException,)),
+            (IntentMismatchException, (ArmorIQException,)),
+            (TokenExpiredException, (InvalidTokenException, ArmorIQException)),
+            (MCPInvocationException, (ArmorIQException,)),
+            (DelegationException, (ArmorIQException,)),
+            (PolicyBlockedException, (ArmorIQException,)),
+            (PolicyHoldException, (ArmorIQException,)),
+            (ConfigurationException, (ArmorIQException,)),
+        ],
+    )
+    def test_inherits(self, exc_cls, bases):
+        exc = exc_cls("e")
+        for base in bases:
+            assert isinstance(exc, base)
 
 
 class TestInvalidTokenException:
@@ -91,6 +91,18 @@ class TestMCPInvocationException:
         assert exc.action == "a"
         assert exc.status_code == 503
 
+    def test_tool_error_formats_lazily(self):
+        exc = MCPInvocationException("boom", mcp="m", action="a", code=-32000, data={"x": 1})
+        assert exc.error_code == -32000
+        assert exc.error_msg == "boom"
+        assert str(exc) == "MCP tool error (-32000): boom - {'x': 1}"
+
+    def test_tool_error_with_null_code_keeps_prefix(self):
+        exc = MCPInvocationException("boom", code=None, data="d")
+        assert exc.error_code is None
+        assert str(exc) == "MCP tool error (None): boom - d"
+        assert str(pickle.loads(pickle.dumps(exc))) == str(exc)
+
 
 class TestDelegationException:
     def test_basic(self):
@@ -161,3 +173,17 @@ class TestExceptionUsage:
         ):
             with pytest.raises(ArmorIQException):
                 raise exc_cls("x")
+
+    def test_subclasses_can_be_combined(self):
+        class Combined(InvalidTokenException, IntentMismatchException):
+            pass
+
+        exc = Combined("x", token_id="t")
+        assert isinstance(exc, IntentMismatchException)
+        assert exc.token_id == "t"
+
+    def test_pickle_keeps_attributes(self):
+        exc = MCPInvocationException("boom", mcp="m", action="a", code=-1, data="d")
+        clone = pickle.loads(pickle.dumps(exc))
+        assert (clone.mcp, clone.action, clone.error_code) == ("m", "a", -1)
+        assert str(clone) == str(exc)
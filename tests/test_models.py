@@ -6,6 +6,7 @@ Covers the full model surface at parity with the TS SDK.
 
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 
 from armoriq_sdk.models import (
     ApprovedDelegation,
@@ -59,7 +60,7 @@ class TestIntentToken:
 
     def test_frozen(self):
         token = _make_token()
-        with pytest.raises(Exception):
+        with pytest.raises(ValidationError, match="frozen"):
             token.token_id = "modified"
 
     def test_optional_fields(self):
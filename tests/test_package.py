@@ -0,0 +1,43 @@
+"""
+Tests for the armoriq_sdk package namespace (lazy exports).
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import armoriq_sdk
+
+
+def test_package_exceptions_import_without_client():
+    code = (
+        "import sys\n"
+        "from armoriq_sdk import InvalidTokenException\n"
+        "assert 'armoriq_sdk.client' not in sys.modules\n"
+        "assert 'httpx' not in sys.modules\n"
+        "import armoriq_sdk\n"
+        "assert armoriq_sdk.ArmorIQClient.__module__ == 'armoriq_sdk.client'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_type_checking_imports_cover_lazy_exports():
+    tree = ast.parse(Path(armoriq_sdk.__file__).read_text())
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    static = {
+        alias.name
+        for node in block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert static == set(armoriq_sdk._LAZY)
+
+
+def test_lazy_exports_resolve():
+    for name in armoriq_sdk._LAZY:
+        assert getattr(armoriq_sdk, name) is not None